@@ -3,10 +3,22 @@ __version__ = "0.6.0"
 
 
 # standard library
+from importlib import import_module
 from logging import getLogger
+from typing import TYPE_CHECKING, Any
 
-# dependencies
-from . import ctrl, daq, qlook, obs, specs, utils
+# submodules (imported on first access)
+if TYPE_CHECKING:
+    from . import ctrl, daq, qlook, obs, specs, utils
 
 # constants
 LOGGER = getLogger(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a submodule of the package on first access (PEP 562)."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = module = import_module(f".{name}", __name__)
+    return module
@@ -7,10 +7,11 @@ from os import getenv
 
 # constants
 LOGGER = getLogger(__name__)
+SIGNAL_SB_SIGNS = {"USB": 1, "LSB": -1}
 
 
 # dependencies
-from .scpi import send_commands
+from .scpi import CustomSerial, CustomSocket, send_commands
 from ..specs.common import (
     CHAN_TOTAL,
     FREQ_INTERVAL,
@@ -23,6 +24,7 @@ from ..specs.common import (
     FreqRange,
     SideBand,
 )
+from ..utils import get_env
 
 
 def on(
@@ -39,6 +41,7 @@ def on(
     sg_host: str | None = None,
     sg_port: int | None = None,
     timeout: float | None = None,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> None:
     """Start outputting the CW signal after setting the SG amplitude and frequency.
 
@@ -57,33 +60,33 @@ def on(
         sg_port: Port number of the SG (e.g. Keysight 8257D).
             If not specified, environment variable ``DRS4_CW_SG_PORT`` will be used.
         timeout: Timeout of the connection process in seconds.
+        conn: If given, the commands will be sent through it
+            instead of a new connection to the SG.
 
     """
     if lo_freq is None:
-        lo_freq = float(getenv(ENV_LO_FREQ, 0.0))
+        lo_freq = get_env(ENV_LO_FREQ, float, 0.0)
 
     if lo_mult is None:
-        lo_mult = int(getenv(ENV_LO_MULT, 0))
+        lo_mult = get_env(ENV_LO_MULT, int, 0)
 
     if sg_ampl is None:
-        sg_ampl = float(getenv(ENV_SG_AMPL, 0.0))
+        sg_ampl = get_env(ENV_SG_AMPL, float, 0.0)
 
     if sg_host is None:
-        sg_host = str(getenv(ENV_SG_ADDR, ""))
+        sg_host = getenv(ENV_SG_ADDR, "")
 
     if sg_port is None:
-        sg_port = int(getenv(ENV_SG_PORT, 0))
+        sg_port = get_env(ENV_SG_PORT, int, 0)
 
     if freq_range == "outer":
         signal_chan = CHAN_TOTAL * 2 - signal_chan
 
-    if signal_sb == "USB":
-        sg_freq = (lo_freq + FREQ_INTERVAL * signal_chan) / lo_mult
-    elif signal_sb == "LSB":
-        sg_freq = (lo_freq - FREQ_INTERVAL * signal_chan) / lo_mult
-    else:
+    if (sign := SIGNAL_SB_SIGNS.get(signal_sb)) is None:
         raise ValueError("Signal sideband must be USB|LSB.")
 
+    sg_freq = (lo_freq + sign * FREQ_INTERVAL * signal_chan) / lo_mult
+
     LOGGER.debug("(")
 
     for key, val in locals().items():
@@ -102,6 +105,7 @@ def on(
         host=sg_host,
         port=sg_port,
         timeout=timeout,
+        conn=conn,
     )
 
 
@@ -111,6 +115,7 @@ def off(
     sg_host: str | None = None,
     sg_port: int | None = None,
     timeout: float | None = None,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> None:
     """Stop outputting the CW signal.
 
@@ -120,13 +125,15 @@ def off(
         sg_port: Port number of the SG (e.g. Keysight 8257D).
             If not specified, environment variable ``DRS4_CW_SG_PORT`` will be used.
         timeout: Timeout of the connection process in seconds.
+        conn: If given, the commands will be sent through it
+            instead of a new connection to the SG.
 
     """
     if sg_host is None:
         sg_host = getenv(ENV_SG_ADDR, "")
 
     if sg_port is None:
-        sg_port = int(getenv(ENV_SG_PORT, ""))
+        sg_port = get_env(ENV_SG_PORT, int)
 
     LOGGER.debug("(")
 
@@ -140,6 +147,7 @@ def off(
         host=sg_host,
         port=sg_port,
         timeout=timeout,
+        conn=conn,
     )
 
 
@@ -149,6 +157,7 @@ def status(
     sg_host: str | None = None,
     sg_port: int | None = None,
     timeout: float | None = None,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> None:
     """Show the status of CW signal in the logger.
 
@@ -158,13 +167,15 @@ def status(
         sg_port: Port number of the SG (e.g. Keysight 8257D).
             If not specified, environment variable ``DRS4_CW_SG_PORT`` will be used.
         timeout: Timeout of the connection process in seconds.
+        conn: If given, the commands will be sent through it
+            instead of a new connection to the SG.
 
     """
     if sg_host is None:
         sg_host = getenv(ENV_SG_ADDR, "")
 
     if sg_port is None:
-        sg_port = int(getenv(ENV_SG_PORT, ""))
+        sg_port = get_env(ENV_SG_PORT, int)
 
     LOGGER.debug("(")
 
@@ -178,5 +189,7 @@ def status(
         host=sg_host,
         port=sg_port,
         timeout=timeout,
+        conn=conn,
+        autocompound=True,
     ):
         LOGGER.info(message)
@@ -2,15 +2,17 @@ __all__ = ["connect", "send_commands", "send_commands_in"]
 
 
 # standard library
+from contextlib import nullcontext
 from logging import getLogger
 from serial import Serial
-from socket import socket, AF_INET, SOCK_STREAM
+from socket import socket, AF_INET, IPPROTO_TCP, SOCK_STREAM, TCP_NODELAY
 from typing import Any, IO, Sequence, overload
 
 # dependencies
 from ..utils import StrPath
 
 # constants
+DEFAULT_AUTOCOMPOUND: bool = False
 DEFAULT_AUTORECV: bool = True
 DEFAULT_BAUDRATE: int = 9600
 DEFAULT_BUFSIZE: int = 4096
@@ -69,9 +71,10 @@ class CustomSocket(socket):
         end: str = DEFAULT_END,
         encoding: str = DEFAULT_ENCODING,
     ) -> int:
-        """Same as socket.send(), but accepts string, not bytes."""
+        """Same as socket.sendall(), but accepts string, not bytes."""
         encoded = (string + end).encode(encoding)
-        n_bytes = super().send(encoded, flags)
+        super().sendall(encoded, flags)
+        n_bytes = len(encoded)
 
         host, port = self.getpeername()
         LOGGER.debug(f"{host}:{port} <- {string}")
@@ -167,6 +170,7 @@ def connect(
         conn = CustomSocket(AF_INET, SOCK_STREAM)
         conn.settimeout(timeout)
         conn.connect((host, port))
+        conn.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
         return conn
 
     raise ValueError("Invalid host or port.")
@@ -182,7 +186,9 @@ def send_commands(
     timeout: float | None = DEFAULT_TIMEOUT,
     encoding: str = DEFAULT_ENCODING,
     autorecv: bool = DEFAULT_AUTORECV,
+    autocompound: bool = DEFAULT_AUTOCOMPOUND,
     bufsize: int = DEFAULT_BUFSIZE,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> tuple[str, ...]: ...
 @overload
 def send_commands(
@@ -194,7 +200,9 @@ def send_commands(
     timeout: float | None = DEFAULT_TIMEOUT,
     encoding: str = DEFAULT_ENCODING,
     autorecv: bool = DEFAULT_AUTORECV,
+    autocompound: bool = DEFAULT_AUTOCOMPOUND,
     bufsize: int = DEFAULT_BUFSIZE,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> tuple[str, ...]: ...
 def send_commands(
     commands: IO[str] | Sequence[str] | str,
@@ -205,7 +213,9 @@ def send_commands(
     timeout: float | None = DEFAULT_TIMEOUT,
     encoding: str = DEFAULT_ENCODING,
     autorecv: bool = DEFAULT_AUTORECV,
+    autocompound: bool = DEFAULT_AUTOCOMPOUND,
     bufsize: int = DEFAULT_BUFSIZE,
+    conn: CustomSerial | CustomSocket | None = None,
 ) -> tuple[str, ...]:
     """Send SCPI command(s) to a server.
 
@@ -217,7 +227,13 @@ def send_commands(
         encoding: Encoding format for the commands.
         autorecv: If True and a command contains '?',
             receive a message and record it to a logger.
+        autocompound: If True and all commands are queries, join them
+            into a single compound query (e.g. 'AMPL?;:FREQ?;*OPC?') and
+            send it at once. The received message is then split into
+            those of the queries. Otherwise the commands are sent as usual.
         bufsize: Maximum byte size for receiving a message.
+        conn: If given, the commands will be sent through it instead of
+            a new connection to the server, and it will not be closed.
 
     Returns:
         Tuple of the received messages.
@@ -231,6 +247,12 @@ def send_commands(
 
             send_commands(['*RST', '*CLS'], '192.168.1.3', 5000)
 
+        To send SCPI commands many times over a single connection::
+
+            with connect('192.168.1.3', 5000) as conn:
+                for _ in range(100):
+                    send_commands('*CLS', host='192.168.1.3', port=5000, conn=conn)
+
     """
     LOGGER.debug("(")
 
@@ -242,21 +264,60 @@ def send_commands(
     if isinstance(commands, str):
         commands = (commands,)
 
-    with connect(host, port, timeout=timeout) as conn:
+    if autocompound:
+        commands = [
+            command
+            for command in map(str.strip, commands)
+            if command and not command.startswith("#")
+        ]
+
+    # fall back to sending the commands one by one unless all are queries
+    if autocompound and (compound := to_compound(commands)) is not None:
+        commands = (compound,)
+    else:
+        autocompound = False
+
+    with (
+        nullcontext(conn) if conn is not None else connect(host, port, timeout=timeout)
+    ) as conn:
         messages: list[str] = []
+        pending: list[str] = []
 
         for command in commands:
-            if not command or command.startswith("#"):
+            if not (command := command.strip()) or command.startswith("#"):
                 continue
 
-            conn.send(command.strip(), encoding=encoding)
+            pending.append(command)
 
+            # send pending commands at once before receiving a message
             if autorecv and "?" in command:
+                conn.send(DEFAULT_END.join(pending), encoding=encoding)
                 messages.append(conn.recv(bufsize))
+                pending.clear()
+
+        if pending:
+            conn.send(DEFAULT_END.join(pending), encoding=encoding)
+
+        if autocompound:
+            return tuple(m for message in messages for m in message.split(";"))
 
         return tuple(messages)
 
 
+def to_compound(commands: Sequence[str], /) -> str | None:
+    """Join SCPI queries into a compound query (None if any is not a query)."""
+    if not commands or not all("?" in command for command in commands):
+        return None
+
+    compound = commands[0]
+
+    # common (*...) or absolute (:...) commands need no colon prefix
+    for command in commands[1:]:
+        compound += (";" if command.startswith(("*", ":")) else ";:") + command
+
+    return compound
+
+
 @overload
 def send_commands_in(
     path: StrPath,
@@ -326,12 +387,14 @@ def send_commands_in(
     LOGGER.debug(")")
 
     with open(path, encoding=encoding) as f:
-        return send_commands(
-            f,
-            host=host,
-            port=port,
-            timeout=timeout,
-            encoding=encoding,
-            autorecv=autorecv,
-            bufsize=bufsize,
-        )
+        commands = f.read().splitlines()
+
+    return send_commands(
+        commands,
+        host=host,
+        port=port,
+        timeout=timeout,
+        encoding=encoding,
+        autorecv=autorecv,
+        bufsize=bufsize,
+    )
@@ -2,16 +2,27 @@ __all__ = ["run", "send", "set_gain"]
 
 
 # standard library
-from logging import getLogger
-from os import getenv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging import DEBUG, getLogger
+from os import fspath, getenv
+from pathlib import Path
 from subprocess import PIPE, CompletedProcess, run as sprun
-from typing import get_args, overload
+from typing import overload
+from warnings import warn
 
 # dependencies
 import xarray as xr
-from ..specs.common import ENV_CTRL_ADDR, ENV_CTRL_USER, Chassis, Interface
-from ..specs.gain import GAIN_ONES, GAIN_ZEROS, open_gain, to_dataframe
-from ..utils import StrPath, is_strpath, set_workdir
+from ..specs.common import (
+    CHASSIS_VALUES,
+    ENV_CTRL_ADDR,
+    ENV_CTRL_USER,
+    INTERFACE_VALUES,
+    Chassis,
+    Interface,
+)
+from ..specs.gain import GAIN_ONES, GAIN_ZEROS, open_gain, to_csv
+from ..utils import SSH_OPTIONS, StrPath, is_strpath
 
 # type hints
 StrCP = CompletedProcess[str]
@@ -31,6 +42,7 @@ def run(
     ctrl_user: str | None = None,
     timeout: float | None = None,
     workdir: StrPath = PATH_CMD_DIR,
+    input: str | None = None,
 ) -> StrCP: ...
 
 
@@ -42,6 +54,7 @@ def run(
     ctrl_user: str | None = None,
     timeout: float | None = None,
     workdir: StrPath = PATH_CMD_DIR,
+    input: str | None = None,
 ) -> tuple[StrCP, StrCP]: ...
 
 
@@ -54,6 +67,7 @@ def run(
     ctrl_user: str | None = None,
     timeout: float | None = None,
     workdir: StrPath = PATH_CMD_DIR,
+    input: str | None = None,
 ) -> StrCP | tuple[StrCP, StrCP]:
     """Run commands in DRS4.
 
@@ -67,6 +81,7 @@ def run(
             environment variable ``DRS4_CHASSIS[1|2]_CTRL_USER`` will be used.
         timeout: Timeout of the connection and the running in seconds.
         workdir: Working directory where commands will be run.
+        input: If given, it will be sent to the standard input of the commands.
 
     Returns:
         Completed process object(s) of the run(s).
@@ -82,22 +97,28 @@ def run(
 
     """
     if chassis is None:
-        return (
-            run(
+        with ThreadPoolExecutor(2) as executor:
+            future_1 = executor.submit(
+                run,
                 *commands,
                 chassis=1,
                 ctrl_addr=ctrl_addr,
                 ctrl_user=ctrl_user,
                 timeout=timeout,
-            ),
-            run(
+                workdir=workdir,
+                input=input,
+            )
+            future_2 = executor.submit(
+                run,
                 *commands,
                 chassis=2,
                 ctrl_addr=ctrl_addr,
                 ctrl_user=ctrl_user,
                 timeout=timeout,
-            ),
-        )
+                workdir=workdir,
+                input=input,
+            )
+            return future_1.result(), future_2.result()
 
     if ctrl_addr is None:
         ctrl_addr = getenv(ENV_CTRL_ADDR.format(chassis), "")
@@ -105,20 +126,21 @@ def run(
     if ctrl_user is None:
         ctrl_user = getenv(ENV_CTRL_USER.format(chassis), "")
 
-    LOGGER.debug("(")
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("(")
 
-    for key, val in locals().items():
-        LOGGER.debug(f"  {key}: {val!r}")
+        for key, val in locals().items():
+            LOGGER.debug(f"  {key}: {val!r}")
 
-    LOGGER.debug(")")
+        LOGGER.debug(")")
 
     script = ";".join((f"cd {workdir}", *commands))
-    args = f"ssh {ctrl_user}@{ctrl_addr} '{script}'"
+    args = ["ssh", *SSH_OPTIONS, f"{ctrl_user}@{ctrl_addr}", script]
     LOGGER.debug(args)
 
     result = sprun(
         args,
-        shell=True,
+        input=input,
         stderr=PIPE,
         stdout=PIPE,
         text=True,
@@ -192,24 +214,26 @@ def send(
 
     """
     if chassis is None:
-        return (
-            send(
+        with ThreadPoolExecutor(2) as executor:
+            future_1 = executor.submit(
+                send,
                 file,
                 to,
                 chassis=1,
                 ctrl_addr=ctrl_addr,
                 ctrl_user=ctrl_user,
                 timeout=timeout,
-            ),
-            send(
+            )
+            future_2 = executor.submit(
+                send,
                 file,
                 to,
                 chassis=2,
                 ctrl_addr=ctrl_addr,
                 ctrl_user=ctrl_user,
                 timeout=timeout,
-            ),
-        )
+            )
+            return future_1.result(), future_2.result()
 
     if ctrl_addr is None:
         ctrl_addr = getenv(ENV_CTRL_ADDR.format(chassis), "")
@@ -217,16 +241,19 @@ def send(
     if ctrl_user is None:
         ctrl_user = getenv(ENV_CTRL_USER.format(chassis), "")
 
-    LOGGER.debug("(")
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("(")
+
+        for key, val in locals().items():
+            LOGGER.debug(f"  {key}: {val!r}")
 
-    for key, val in locals().items():
-        LOGGER.debug(f"  {key}: {val!r}")
+        LOGGER.debug(")")
 
-    LOGGER.debug(")")
+    args = ["scp", *SSH_OPTIONS, str(file), f"{ctrl_user}@{ctrl_addr}:{to}"]
+    LOGGER.debug(args)
 
     result = sprun(
-        f"scp {file} {ctrl_user}@{ctrl_addr}:{to}",
-        shell=True,
+        args,
         stderr=PIPE,
         stdout=PIPE,
         text=True,
@@ -276,58 +303,35 @@ def set_gain(
         ctrl_user: User name of DRS4. If not specified,
             environment variable ``DRS4_CHASSIS[1|2]_CTRL_USER`` will be used.
         timeout: Timeout of the connection and the running in seconds.
-        workdir: Working directory where an intermediate file will be put.
+        workdir: Deprecated and ignored. The gain is no longer written
+            to an intermediate file but sent through the SSH connection.
 
     """
-    if chassis is None:
-        for chassis in get_args(Chassis):
-            set_gain(
-                ms,
-                chassis=chassis,
-                interface=interface,
-                ones=ones,
-                zeros=zeros,
-                ctrl_addr=ctrl_addr,
-                ctrl_user=ctrl_user,
-                timeout=timeout,
-                workdir=workdir,
-            )
-
-        return
-
-    if interface is None:
-        for interface in get_args(Interface):
-            set_gain(
-                ms,
-                chassis=chassis,
-                interface=interface,
-                ones=ones,
-                zeros=zeros,
-                ctrl_addr=ctrl_addr,
-                ctrl_user=ctrl_user,
-                timeout=timeout,
-                workdir=workdir,
-            )
-
-        return
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("(")
 
-    LOGGER.debug("(")
+        for key, val in locals().items():
+            LOGGER.debug(f"  {key}: {val!r}")
 
-    for key, val in locals().items():
-        LOGGER.debug(f"  {key}: {val!r}")
+        LOGGER.debug(")")
 
-    LOGGER.debug(")")
+    if workdir is not None:
+        warn(
+            "workdir is deprecated and ignored (no intermediate file is used).",
+            FutureWarning,
+            stacklevel=2,
+        )
 
-    if chassis not in get_args(Chassis):
+    if chassis is not None and chassis not in CHASSIS_VALUES:
         raise ValueError("Chassis number must be 1|2.")
 
-    if interface not in get_args(Interface):
+    if interface is not None and interface not in INTERFACE_VALUES:
         raise ValueError("Interface number must be 1|2.")
 
     if isinstance(ms, xr.Dataset) and not ones and not zeros:
         ds = ms
     elif is_strpath(ms) and not ones and not zeros:
-        ds = open_gain(ms)
+        ds = open_gain_cached(fspath(ms), get_mtime(ms))
     elif ms is None and ones and not zeros:
         ds = GAIN_ONES
     elif ms is None and not ones and zeros:
@@ -335,24 +339,72 @@ def set_gain(
     else:
         raise ValueError("Either ms, ones, or zeros must be given.")
 
-    with set_workdir(workdir) as workdir:
-        to_dataframe(ds).to_csv(csv := workdir / "coef_table.csv")
+    # upload and apply the gain within a single SSH invocation per chassis
+    chasses = CHASSIS_VALUES if chassis is None else (chassis,)
+    interfaces = INTERFACE_VALUES if interface is None else (interface,)
+    commands = [f"cat > {PATH_COEF_TABLE} || exit 1"]
 
-        result = send(
-            csv,
-            PATH_COEF_TABLE,
-            chassis=chassis,
-            ctrl_addr=ctrl_addr,
-            ctrl_user=ctrl_user,
-            timeout=timeout,
-        )
-        result.check_returncode()
-
-        result = run(
-            f"./set_coef_tbl.py --In {1 if interface == 1 else 3}",
-            chassis=chassis,
-            ctrl_addr=ctrl_addr,
-            ctrl_user=ctrl_user,
-            timeout=timeout,
-        )
-        result.check_returncode()
+    # run the command per interface concurrently and fail if any of them fails
+    for i in interfaces:
+        commands.append(f'./set_coef_tbl.py --In {2 * i - 1} & pids="$pids $!"')
+
+    commands.append("for pid in $pids; do wait $pid || exit 1; done")
+
+    table = to_csv(ds)
+
+    with ThreadPoolExecutor(len(chasses)) as executor:
+        futures = [
+            executor.submit(
+                run,
+                *commands,
+                chassis=c,
+                ctrl_addr=ctrl_addr,
+                ctrl_user=ctrl_user,
+                timeout=timeout,
+                input=table,
+            )
+            for c in chasses
+        ]
+
+    for future in futures:
+        future.result().check_returncode()
+
+
+def get_mtime(path: StrPath, /) -> float:
+    """Return the latest modified time of a file or a directory.
+
+    Args:
+        path: Path of the file or the directory (e.g. directory Zarr store).
+            The contents of a directory are also checked since rewriting
+            a chunk file does not change the modified time of the directory.
+
+    Returns:
+        Latest modified time in units of seconds since the epoch.
+
+    """
+    if not (path := Path(path)).is_dir():
+        return path.stat().st_mtime
+
+    return max(file.stat().st_mtime for file in (path, *path.rglob("*")))
+
+
+def open_gain_cached(ms: str, mtime: float, /) -> xr.Dataset:
+    """Open a gain file (DRS4 MS file) and cache the loaded Dataset.
+
+    Args:
+        ms: Path of input gain file (DRS4 MS file).
+        mtime: Latest modified time of the gain file as a part of the cache
+            key so that a modified file (or directory) will be opened again.
+
+    Returns:
+        Copy of the cached Dataset of the input gain file
+        so that modifying it does not affect the cache.
+
+    """
+    return load_gain(ms, mtime).copy(deep=True)
+
+
+@lru_cache(maxsize=4)
+def load_gain(ms: str, mtime: float, /) -> xr.Dataset:
+    """Open a gain file (DRS4 MS file) and load it into memory (cached)."""
+    return open_gain(ms).load()
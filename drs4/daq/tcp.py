@@ -2,12 +2,12 @@ __all__ = ["cross"]
 
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from logging import getLogger
+from logging import DEBUG, getLogger
 from os import getenv
 from pathlib import Path
 from time import sleep
-from typing import get_args
 
 # dependencies
 import xarray as xr
@@ -15,12 +15,14 @@ from tqdm import tqdm
 from ..ctrl.self import run, set_gain
 from ..specs.common import (
     CHAN_TOTAL,
+    CHASSIS_VALUES,
     CSV_AUTOS_FORMAT,
     CSV_CROSS_FORMAT,
     ENV_CTRL_ADDR,
     ENV_CTRL_USER,
+    FREQ_RANGE_VALUES,
+    INTEG_TIME_VALUES,
     OBSID_FORMAT,
-    ZARR_ENCODING,
     ZARR_FORMAT,
     Channel,
     Chassis,
@@ -30,15 +32,32 @@ from ..specs.common import (
     Interface,
     SideBand,
 )
-from ..specs.ms import open_csvs
+from ..specs.ms import open_csvs, to_zarrs
 from ..specs.csv import TIME_FORMAT
-from ..utils import StrPath, XarrayJoin, set_workdir, unique
+from ..utils import StrPath, XarrayJoin, set_workdir
 
 # constants
 CSV_AUTOS = "~/DRS4/mrdsppy/output/new_pow.csv"
+CSV_BUFFERING = 1024 * 1024  # byte
 CSV_CROSS = "~/DRS4/mrdsppy/output/new_phase.csv"
 CSV_ROW_TOTAL = CHAN_TOTAL + 1  # 1 means header
+CSV_STAMP = (  # modified times of both CSVs before they are rewritten
+    f"autos=$(stat -c %y {CSV_AUTOS} 2>/dev/null);"
+    f" cross=$(stat -c %y {CSV_CROSS} 2>/dev/null)"
+)
+CSV_WAIT = (  # poll every 50 ms (up to 1 s) until both CSVs are rewritten
+    f"for i in $(seq 20); do"
+    f' [ "$(stat -c %y {CSV_AUTOS} 2>/dev/null)" != "$autos" ]'
+    f' && [ "$(stat -c %y {CSV_CROSS} 2>/dev/null)" != "$cross" ]'
+    f" && [ $(cat {CSV_AUTOS} | awk 'END {{print NR}}') -ge {CSV_ROW_TOTAL} ]"
+    f" && [ $(cat {CSV_CROSS} | awk 'END {{print NR}}') -ge {CSV_ROW_TOTAL} ]"
+    f" && break; sleep 0.05; done 2>/dev/null"
+)
 LOGGER = getLogger(__name__)
+ROWS_AUTOS_IF1 = slice(CSV_ROW_TOTAL * 0 + 1, CSV_ROW_TOTAL * 1 + 1)
+ROWS_CROSS_IF1 = slice(CSV_ROW_TOTAL * 1 + 1, CSV_ROW_TOTAL * 2 + 1)
+ROWS_AUTOS_IF2 = slice(CSV_ROW_TOTAL * 2 + 2, CSV_ROW_TOTAL * 3 + 2)
+ROWS_CROSS_IF2 = slice(CSV_ROW_TOTAL * 3 + 2, CSV_ROW_TOTAL * 4 + 2)
 
 
 def cross(
@@ -73,6 +92,10 @@ def cross(
     timeout: float | None = None,
 ) -> tuple[Path, Path]:
     """"""
+    # environment variables depend on the chassis number
+    if chassis not in CHASSIS_VALUES:
+        raise ValueError("Chassis number must be 1|2.")
+
     obsid = datetime.now(timezone.utc).strftime(OBSID_FORMAT)
 
     if ctrl_addr is None:
@@ -87,26 +110,24 @@ def cross(
     if zarr_if2 is None:
         zarr_if2 = ZARR_FORMAT.format(obsid, chassis, 2)
 
-    LOGGER.debug("(")
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("(")
 
-    for key, val in locals().items():
-        LOGGER.debug(f"  {key}: {val!r}")
+        for key, val in locals().items():
+            LOGGER.debug(f"  {key}: {val!r}")
 
-    LOGGER.debug(")")
+        LOGGER.debug(")")
 
     if append and overwrite:
         raise ValueError("Append and overwrite cannot be enabled at once.")
 
-    if chassis not in get_args(Chassis):
-        raise ValueError("Chassis number must be 1|2.")
-
-    if freq_range_if1 not in get_args(FreqRange):
+    if freq_range_if1 not in FREQ_RANGE_VALUES:
         raise ValueError("Frequency range must be inner|outer.")
 
-    if freq_range_if2 not in get_args(FreqRange):
+    if freq_range_if2 not in FREQ_RANGE_VALUES:
         raise ValueError("Frequency range must be inner|outer.")
 
-    if integ_time not in get_args(IntegTime):
+    if integ_time not in INTEG_TIME_VALUES:
         raise ValueError("Spectral integration time must be 100|200|500|1000.")
 
     if (zarr_if1 := Path(zarr_if1)).exists() and not append and not overwrite:
@@ -153,18 +174,22 @@ def cross(
         open(
             csv_autos_if1 := workdir / CSV_AUTOS_FORMAT.format(obsid, chassis, 1),
             mode="w",
+            buffering=CSV_BUFFERING,
         ) as f_autos_if1,
         open(
             csv_cross_if1 := workdir / CSV_CROSS_FORMAT.format(obsid, chassis, 1),
             mode="w",
+            buffering=CSV_BUFFERING,
         ) as f_cross_if1,
         open(
             csv_autos_if2 := workdir / CSV_AUTOS_FORMAT.format(obsid, chassis, 2),
             mode="w",
+            buffering=CSV_BUFFERING,
         ) as f_autos_if2,
         open(
             csv_cross_if2 := workdir / CSV_CROSS_FORMAT.format(obsid, chassis, 2),
             mode="w",
+            buffering=CSV_BUFFERING,
         ) as f_cross_if2,
     ):
         try:
@@ -172,13 +197,15 @@ def cross(
                 time = datetime.now(timezone.utc).strftime(TIME_FORMAT)
                 result = run(
                     # for interface 1
+                    CSV_STAMP,
                     f"./get_corr_rslt.py --In 1",
-                    "sleep 1",
+                    CSV_WAIT,
                     f"cat {CSV_AUTOS}",
                     f"cat {CSV_CROSS}",
                     # for interface 2
+                    CSV_STAMP,
                     f"./get_corr_rslt.py --In 3",
-                    "sleep 1",
+                    CSV_WAIT,
                     f"cat {CSV_AUTOS}",
                     f"cat {CSV_CROSS}",
                     chassis=chassis,
@@ -187,27 +214,20 @@ def cross(
                 result.check_returncode()
                 rows = result.stdout.split()
 
-                # write header
-                if cycle == 0:
-                    f_autos_if1.write(f"time,{rows[CSV_ROW_TOTAL * 0 + 1]}\n")
-                    f_cross_if1.write(f"time,{rows[CSV_ROW_TOTAL * 1 + 1]}\n")
-                    f_autos_if2.write(f"time,{rows[CSV_ROW_TOTAL * 2 + 2]}\n")
-                    f_cross_if2.write(f"time,{rows[CSV_ROW_TOTAL * 3 + 2]}\n")
+                for file, index in (
+                    (f_autos_if1, ROWS_AUTOS_IF1),
+                    (f_cross_if1, ROWS_CROSS_IF1),
+                    (f_autos_if2, ROWS_AUTOS_IF2),
+                    (f_cross_if2, ROWS_CROSS_IF2),
+                ):
+                    header, *data = rows[index]
 
-                # write data
-                for ch in range(CHAN_TOTAL):
-                    f_autos_if1.write(
-                        f"{time},{rows[(CSV_ROW_TOTAL * 0 + 1) + ch + 1]}\n"
-                    )
-                    f_cross_if1.write(
-                        f"{time},{rows[(CSV_ROW_TOTAL * 1 + 1) + ch + 1]}\n"
-                    )
-                    f_autos_if2.write(
-                        f"{time},{rows[(CSV_ROW_TOTAL * 2 + 2) + ch + 1]}\n"
-                    )
-                    f_cross_if2.write(
-                        f"{time},{rows[(CSV_ROW_TOTAL * 3 + 2) + ch + 1]}\n"
-                    )
+                    # write header
+                    if cycle == 0:
+                        file.write(f"time,{header}\n")
+
+                    # write data
+                    file.write(f"{time}," + f"\n{time},".join(data) + "\n")
 
                 bar.update(1)
         except KeyboardInterrupt:
@@ -218,8 +238,10 @@ def cross(
             f_autos_if2.flush()
             f_cross_if2.flush()
 
-        ds_if1, ds_if2 = xr.align(
-            open_csvs(
+        # load each IF concurrently
+        with ThreadPoolExecutor(2) as executor:
+            future_if1 = executor.submit(
+                open_csvs,
                 csv_autos_if1,
                 csv_cross_if1,
                 # for measurement (required)
@@ -230,8 +252,9 @@ def cross(
                 integ_time=integ_time,
                 signal_sb=signal_sb if signal_if == 1 else None,
                 signal_chan=signal_chan if signal_if == 1 else None,
-            ),
-            open_csvs(
+            )
+            future_if2 = executor.submit(
+                open_csvs,
                 csv_autos_if2,
                 csv_cross_if2,
                 # for measurement (required)
@@ -242,24 +265,19 @@ def cross(
                 integ_time=integ_time,
                 signal_sb=signal_sb if signal_if == 2 else None,
                 signal_chan=signal_chan if signal_if == 2 else None,
-            ),
+            )
+            ds_if1 = future_if1.result()
+            ds_if2 = future_if2.result()
+
+        # integrate and write each IF concurrently
+        to_zarrs(
+            ds_if1,
+            ds_if2,
+            zarr_if1,
+            zarr_if2,
+            integrate=integrate,
+            append=append,
             join=join,
         )
 
-        if integrate:
-            dim = {"time": ds_if1.sizes["time"]}
-            coord_func = {"signal_chan": unique, "signal_sb": unique}
-            ds_if1 = ds_if1.coarsen(dim, coord_func=coord_func).mean()  # type: ignore
-            ds_if2 = ds_if2.coarsen(dim, coord_func=coord_func).mean()  # type: ignore
-
-        if zarr_if1.exists() and append:
-            ds_if1.to_zarr(zarr_if1, mode="a", append_dim="time")  # type: ignore
-        else:
-            ds_if1.to_zarr(zarr_if1, mode="w", encoding=ZARR_ENCODING)  # type: ignore
-
-        if zarr_if2.exists() and append:
-            ds_if2.to_zarr(zarr_if2, mode="a", append_dim="time")  # type: ignore
-        else:
-            ds_if2.to_zarr(zarr_if2, mode="w", encoding=ZARR_ENCODING)  # type: ignore
-
         return zarr_if1.resolve(), zarr_if2.resolve()
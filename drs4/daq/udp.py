@@ -2,30 +2,73 @@ __all__ = ["auto"]
 
 
 # standard library
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from ctypes import (
+    CDLL,
+    POINTER,
+    Structure,
+    addressof,
+    byref,
+    c_char,
+    c_int,
+    c_size_t,
+    c_uint,
+    c_uint32,
+    c_void_p,
+    get_errno,
+    pointer,
+    sizeof,
+)
 from datetime import datetime, timezone
-from logging import getLogger
-from multiprocessing import Manager
-from os import getenv
+from errno import EAGAIN, EINTR
+from logging import DEBUG, getLogger
+from multiprocessing import Process, get_context
+from multiprocessing.synchronize import Event
+from os import cpu_count, getenv, strerror
 from pathlib import Path
 from socket import (
     IP_ADD_MEMBERSHIP,
     IPPROTO_IP,
+    SO_RCVBUF,
     SO_REUSEADDR,
     SOCK_DGRAM,
     SOL_SOCKET,
     inet_aton,
     socket,
 )
-from threading import Event
-from time import sleep
-from typing import get_args
+from selectors import EVENT_READ, DefaultSelector
+from time import monotonic, sleep
+from sys import byteorder
+from typing import Any, BinaryIO, Iterable, Sequence
+
+# standard library (only available on some Unix platforms)
+try:
+    from os import posix_fallocate
+except ImportError:
+    posix_fallocate = None  # type: ignore
+
+try:
+    from os import sched_setaffinity
+except ImportError:
+    sched_setaffinity = None  # type: ignore
+
+try:
+    from os import writev
+except ImportError:
+    writev = None  # type: ignore
+
+try:
+    from socket import CMSG_SPACE
+except ImportError:
+    CMSG_SPACE = None  # type: ignore
 
 # dependencies
 import xarray as xr
 from tqdm import tqdm
 from ..ctrl.self import run, set_gain
 from ..specs.common import (
+    CHASSIS_VALUES,
     ENV_CTRL_ADDR,
     ENV_CTRL_USER,
     ENV_DEST_ADDR,
@@ -33,9 +76,10 @@ from ..specs.common import (
     ENV_DEST_PORT2,
     ENV_DEST_PORT3,
     ENV_DEST_PORT4,
+    FREQ_RANGE_VALUES,
+    INTEG_TIME_VALUES,
     OBSID_FORMAT,
     VDIF_FORMAT,
-    ZARR_ENCODING,
     ZARR_FORMAT,
     Channel,
     Chassis,
@@ -45,13 +89,20 @@ from ..specs.common import (
     IntegTime,
     SideBand,
 )
-from ..specs.ms import open_vdifs
+from ..specs.ms import open_vdifs, to_zarrs
 from ..specs.vdif import VDIF_FRAME_BYTES
-from ..utils import StrPath, XarrayJoin, set_workdir, unique
+from ..utils import StrPath, XarrayJoin, get_env, set_workdir
 
 # constants
+CONTROL_BYTES = 0 if CMSG_SPACE is None else CMSG_SPACE(4)  # for SO_RXQ_OVFL
 GROUP = "239.0.0.1"
 LOGGER = getLogger(__name__)
+MSG_WAITFORONE = 0x10000
+POLL_INTERVAL = 0.1  # s
+RCVBUF = 12 * 1024 * 1024  # byte
+RECV_FRAMES = 1024
+SO_RCVBUFFORCE = 33
+SO_RXQ_OVFL = 40
 
 
 def auto(
@@ -88,9 +139,16 @@ def auto(
     dest_port2: int | None = None,
     dest_port3: int | None = None,
     dest_port4: int | None = None,
+    rcvbuf: int = RCVBUF,
+    cpus: Sequence[int] | None = None,
+    nic: str | None = None,
     timeout: float | None = None,
 ) -> tuple[Path, Path]:
     """"""
+    # environment variables depend on the chassis number
+    if chassis not in CHASSIS_VALUES:
+        raise ValueError("Chassis number must be 1|2.")
+
     obsid = datetime.now(timezone.utc).strftime(OBSID_FORMAT)
 
     if ctrl_addr is None:
@@ -103,16 +161,19 @@ def auto(
         dest_addr = getenv(ENV_DEST_ADDR.format(chassis), "")
 
     if dest_port1 is None:
-        dest_port1 = int(getenv(ENV_DEST_PORT1.format(chassis), ""))
+        dest_port1 = get_env(ENV_DEST_PORT1.format(chassis), int)
 
     if dest_port2 is None:
-        dest_port2 = int(getenv(ENV_DEST_PORT2.format(chassis), ""))
+        dest_port2 = get_env(ENV_DEST_PORT2.format(chassis), int)
 
     if dest_port3 is None:
-        dest_port3 = int(getenv(ENV_DEST_PORT3.format(chassis), ""))
+        dest_port3 = get_env(ENV_DEST_PORT3.format(chassis), int)
 
     if dest_port4 is None:
-        dest_port4 = int(getenv(ENV_DEST_PORT4.format(chassis), ""))
+        dest_port4 = get_env(ENV_DEST_PORT4.format(chassis), int)
+
+    if cpus is None and nic is not None:
+        cpus = get_numa_cpus(nic)
 
     if zarr_if1 is None:
         zarr_if1 = ZARR_FORMAT.format(obsid, chassis, 1)
@@ -120,26 +181,24 @@ def auto(
     if zarr_if2 is None:
         zarr_if2 = ZARR_FORMAT.format(obsid, chassis, 2)
 
-    LOGGER.debug("(")
+    if LOGGER.isEnabledFor(DEBUG):
+        LOGGER.debug("(")
 
-    for key, val in locals().items():
-        LOGGER.debug(f"  {key}: {val!r}")
+        for key, val in locals().items():
+            LOGGER.debug(f"  {key}: {val!r}")
 
-    LOGGER.debug(")")
+        LOGGER.debug(")")
 
     if append and overwrite:
         raise ValueError("Append and overwrite cannot be enabled at once.")
 
-    if chassis not in get_args(Chassis):
-        raise ValueError("Chassis number must be 1|2.")
-
-    if freq_range_if1 not in get_args(FreqRange):
+    if freq_range_if1 not in FREQ_RANGE_VALUES:
         raise ValueError("Frequency range must be inner|outer.")
 
-    if freq_range_if2 not in get_args(FreqRange):
+    if freq_range_if2 not in FREQ_RANGE_VALUES:
         raise ValueError("Frequency range must be inner|outer.")
 
-    if integ_time not in get_args(IntegTime):
+    if integ_time not in INTEG_TIME_VALUES:
         raise ValueError("Spectral integration time must be 100|200|500|1000.")
 
     if (zarr_if1 := Path(zarr_if1)).exists() and not append and not overwrite:
@@ -181,60 +240,54 @@ def auto(
         sleep(1.5)
 
     with (
-        Manager() as manager,
-        ProcessPoolExecutor(4) as executor,
         set_workdir(workdir) as workdir,
         tqdm(disable=not progress, total=int(duration), unit="s") as bar,
     ):
-        cancel = manager.Event()
-        executor.submit(
-            dump,
-            vdif_in1 := workdir / VDIF_FORMAT.format(obsid, chassis, 1),
-            dest_addr=dest_addr,
-            dest_port=dest_port1,
-            cancel=cancel,
-            timeout=timeout,
-            overwrite=overwrite,
-        )
-        executor.submit(
-            dump,
-            vdif_in2 := workdir / VDIF_FORMAT.format(obsid, chassis, 2),
-            dest_addr=dest_addr,
-            dest_port=dest_port2,
-            cancel=cancel,
-            timeout=timeout,
-            overwrite=overwrite,
-        )
-        executor.submit(
-            dump,
-            vdif_in3 := workdir / VDIF_FORMAT.format(obsid, chassis, 3),
-            dest_addr=dest_addr,
-            dest_port=dest_port3,
-            cancel=cancel,
-            timeout=timeout,
-            overwrite=overwrite,
-        )
-        executor.submit(
-            dump,
-            vdif_in4 := workdir / VDIF_FORMAT.format(obsid, chassis, 4),
-            dest_addr=dest_addr,
-            dest_port=dest_port4,
-            cancel=cancel,
-            timeout=timeout,
-            overwrite=overwrite,
+        cancel = get_context().Event()
+        vdifs = [workdir / VDIF_FORMAT.format(obsid, chassis, i) for i in range(1, 5)]
+        vdif_in1, vdif_in2, vdif_in3, vdif_in4 = vdifs
+        process = Process(
+            target=dump,
+            args=(vdifs,),
+            kwargs=dict(
+                dest_addr=dest_addr,
+                dest_ports=(dest_port1, dest_port2, dest_port3, dest_port4),
+                rcvbuf=rcvbuf,
+                cpus=cpus,
+                cancel=cancel,
+                size=int(duration * 2000 // integ_time) * VDIF_FRAME_BYTES,
+                timeout=timeout,
+                overwrite=overwrite,
+            ),
         )
+        process.start()
 
         try:
-            for _ in range(int(duration)):
-                sleep(1)
-                bar.update(1)
+            deadline = monotonic() + duration
+
+            # also stop waiting if the dumping process exits early (e.g. error)
+            while (remaining := deadline - monotonic()) > 0:
+                process.join(min(1.0, remaining))
+
+                if process.exitcode is not None:
+                    break
+
+                bar.n = int(duration - max(deadline - monotonic(), 0))
+                bar.refresh()
         except KeyboardInterrupt:
             LOGGER.warning("Data acquisition interrupted by user.")
         finally:
             cancel.set()
+            process.join()
+
+        # e.g. TimeoutError or OSError raised in the dumping process
+        if process.exitcode != 0:
+            raise RuntimeError(f"Dumping failed (exit code: {process.exitcode}).")
 
-        ds_if1, ds_if2 = xr.align(
-            open_vdifs(
+        # load each IF concurrently
+        with ThreadPoolExecutor(2) as executor:
+            future_if1 = executor.submit(
+                open_vdifs,
                 vdif_in1,
                 vdif_in2,
                 # for measurement (required)
@@ -247,8 +300,9 @@ def auto(
                 signal_chan=signal_chan if signal_if == 1 else None,
                 # for file loading (optional)
                 join=join,
-            ),
-            open_vdifs(
+            )
+            future_if2 = executor.submit(
+                open_vdifs,
                 vdif_in3,
                 vdif_in4,
                 # for measurement (required)
@@ -261,91 +315,393 @@ def auto(
                 signal_chan=signal_chan if signal_if == 2 else None,
                 # for file loading (optional)
                 join=join,
-            ),
+            )
+            ds_if1 = future_if1.result()
+            ds_if2 = future_if2.result()
+
+        # integrate and write each IF concurrently
+        to_zarrs(
+            ds_if1,
+            ds_if2,
+            zarr_if1,
+            zarr_if2,
+            integrate=integrate,
+            append=append,
             join=join,
         )
 
-        if integrate:
-            dim = {"time": ds_if1.sizes["time"]}
-            coord_func = {"signal_chan": unique, "signal_sb": unique}
-            ds_if1 = ds_if1.coarsen(dim, coord_func=coord_func).mean()  # type: ignore
-            ds_if2 = ds_if2.coarsen(dim, coord_func=coord_func).mean()  # type: ignore
-
-        if zarr_if1.exists() and append:
-            ds_if1.to_zarr(zarr_if1, mode="a", append_dim="time")  # type: ignore
-        else:
-            ds_if1.to_zarr(zarr_if1, mode="w", encoding=ZARR_ENCODING)  # type: ignore
-
-        if zarr_if2.exists() and append:
-            ds_if2.to_zarr(zarr_if2, mode="a", append_dim="time")  # type: ignore
-        else:
-            ds_if2.to_zarr(zarr_if2, mode="w", encoding=ZARR_ENCODING)  # type: ignore
-
         return zarr_if1.resolve(), zarr_if2.resolve()
 
 
 def dump(
-    vdif: StrPath,
+    vdifs: Sequence[StrPath],
     /,
     *,
     # for connection (required)
     dest_addr: str,
-    dest_port: int,
+    dest_ports: Sequence[int],
     # for connection (optional)
     group: str = GROUP,
+    rcvbuf: int = RCVBUF,
+    cpus: Iterable[int] | None = None,
     # for file saving (optional)
     cancel: Event | None = None,
+    size: int | None = None,
     timeout: float | None = None,
     progress: bool = False,
     overwrite: bool = False,
 ) -> None:
-    """Receive and dump DRS4 data per input into a VDIF file.
+    """Receive and dump DRS4 data of multiple inputs into VDIF files.
+
+    All inputs are multiplexed in a single process by ``epoll(7)``
+    (or the best I/O multiplexing available on the platform).
 
     Args:
-        vdif: Path of the output VDIF file.
+        vdifs: Paths of the output VDIF files (one per input).
         dest_addr: Destination IP address.
-        dest_port: Destination port number.
+        dest_ports: Destination port numbers (one per input).
         group: Multicast group IP address.
+        rcvbuf: Byte size of the kernel receive buffer of each socket.
+            Note that it is capped by ``net.core.rmem_max`` unless run by root
+            (e.g. ``sysctl -w net.core.rmem_max=12582912`` to allow the default).
+            Frames dropped by the kernel due to a full buffer are logged
+            as warnings where ``SO_RXQ_OVFL`` is available (Linux).
+        cpus: If given, the process will be pinned to the CPU(s).
+            CPU(s) on the same NUMA node as the NIC are recommended
+            (see also ``get_numa_cpus``). The NIC side can be tuned by
+            ``ethtool -G <nic> rx <max>`` and its IRQ affinity
+            (``/proc/irq/<irq>/smp_affinity_list``) on the same CPU(s).
         cancel: Event object to cancel dumping.
+        size: If given, byte size preallocated for each VDIF file
+            to avoid incremental block allocation by the file system
+            (ignored where posix_fallocate is unavailable).
+            The file is truncated to the actually written size at the end.
         timeout: Timeout period in units of seconds.
         progress: Whether to show the progress bar on screen.
-        overwrite: Whether to overwrite the existing VDIF file.
+        overwrite: Whether to overwrite the existing VDIF files.
 
     Raises:
         FileExistsError: Raised if overwrite is not allowed
-            and the output VDIF file already exists.
+            and any of the output VDIF files already exists.
         TimeoutError: Raised if no DRS4 data (i.e. VDIF frame)
-            is received for the timeout period.
+            is received by any input for the timeout period.
+        ValueError: Raised if the numbers of the VDIF files
+            and the destination port numbers are not the same.
 
     """
-    if not overwrite and Path(vdif).exists():
-        raise FileExistsError(vdif)
+    if len(vdifs) != len(dest_ports):
+        raise ValueError("Numbers of VDIF files and ports must be the same.")
+
+    for vdif in vdifs:
+        if not overwrite and Path(vdif).exists():
+            raise FileExistsError(vdif)
 
-    prefix = f"[{dest_addr=}, {dest_port=}]"
     mreq = inet_aton(group) + inet_aton(dest_addr)
 
+    if cpus is not None and sched_setaffinity is not None:
+        sched_setaffinity(0, cpus)
+    elif cpus is not None:
+        LOGGER.warning("CPU affinity cannot be set on this platform.")
+
     with (
-        open(vdif, "wb") as file,
-        socket(type=SOCK_DGRAM) as sock,
-        tqdm(desc=prefix, disable=not progress, unit="byte") as bar,
+        ExitStack() as stack,
+        DefaultSelector() as selector,
+        tqdm(desc=f"[{dest_addr=}]", disable=not progress, unit="byte") as bar,
     ):
-        # create socket
-        sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
-        sock.bind(("", dest_port))
-        sock.setsockopt(IPPROTO_IP, IP_ADD_MEMBERSHIP, mreq)
-        sock.settimeout(timeout)
+        for vdif, dest_port in zip(vdifs, dest_ports):
+            prefix = f"[{dest_addr=}, {dest_port=}]"
+            file = stack.enter_context(open(vdif, "wb", buffering=0))
+
+            # preallocation is skipped where posix_fallocate is unavailable
+            if size is not None and posix_fallocate is not None:
+                posix_fallocate(file.fileno(), 0, size)
+                stack.callback(file.truncate)
+
+            sock = stack.enter_context(socket(type=SOCK_DGRAM))
+
+            # create socket
+            sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+
+            try:
+                sock.setsockopt(SOL_SOCKET, SO_RCVBUFFORCE, rcvbuf)
+            except OSError:
+                sock.setsockopt(SOL_SOCKET, SO_RCVBUF, rcvbuf)
+
+            # Linux reports the doubled size of the actually allocated buffer
+            if sock.getsockopt(SOL_SOCKET, SO_RCVBUF) < rcvbuf:
+                LOGGER.warning(
+                    f"{prefix} Receive buffer is capped by net.core.rmem_max."
+                )
+
+            try:
+                # report frames dropped by the kernel (Linux only)
+                sock.setsockopt(SOL_SOCKET, SO_RXQ_OVFL, 1)
+            except OSError:
+                LOGGER.debug(f"{prefix} Dropped frames cannot be reported.")
+
+            sock.bind(("", dest_port))
+            sock.setsockopt(IPPROTO_IP, IP_ADD_MEMBERSHIP, mreq)
+            sock.setblocking(False)
+
+            buffer = FrameBuffer(RECV_FRAMES, VDIF_FRAME_BYTES)
+            selector.register(sock, EVENT_READ, (prefix, file, buffer))
+
+        def flush(prefix: str, file: BinaryIO, buffer: FrameBuffer, /) -> None:
+            n_frames = buffer.n_filled
+
+            if (n_written := buffer.flush(file)) < n_frames:
+                LOGGER.warning(f"{prefix} Truncated frame(s): {n_frames - n_written}.")
+
+            if buffer.n_dropped:
+                LOGGER.warning(f"{prefix} Dropped frame(s): {buffer.n_dropped}.")
+                buffer.n_dropped = 0
+
+            bar.update(n_written * VDIF_FRAME_BYTES)
 
         # start dumping
-        LOGGER.debug(f"{prefix} Start dumping data.")
+        LOGGER.debug(f"[{dest_addr=}] Start dumping data.")
+        keys = list(selector.get_map().values())
+        received = dict.fromkeys((key.fd for key in keys), monotonic())
 
-        while cancel is None or not cancel.is_set():
-            frame, _ = sock.recvfrom(VDIF_FRAME_BYTES)
+        # cancellation is checked once per poll of the inputs
+        is_cancelled = (lambda: False) if cancel is None else cancel.is_set
 
-            if len(frame) == VDIF_FRAME_BYTES:
-                file.write(frame)
-                bar.update(VDIF_FRAME_BYTES)
-            else:
-                LOGGER.warning(f"{prefix} Truncated frame.")
+        try:
+            while not is_cancelled():
+                for key, _ in selector.select(POLL_INTERVAL):
+                    prefix, file, buffer = key.data
+
+                    if buffer.recv(key.fileobj):  # type: ignore
+                        received[key.fd] = monotonic()
+
+                    if buffer.is_full:
+                        flush(prefix, file, buffer)
+
+                if timeout is None:
+                    continue
+
+                for key in keys:
+                    if monotonic() - received[key.fd] > timeout:
+                        raise TimeoutError(f"{key.data[0]} timed out")
+        except KeyboardInterrupt:
+            # also sent to a child process by Ctrl+C (i.e. same as cancel)
+            LOGGER.debug(f"[{dest_addr=}] Dumping interrupted by user.")
+        finally:
+            for key in keys:
+                flush(*key.data)
 
         # finish dumping
-        LOGGER.debug(f"{prefix} Finish dumping data.")
+        LOGGER.debug(f"[{dest_addr=}] Finish dumping data.")
+
+
+class IOVec(Structure):
+    _fields_ = [("iov_base", c_void_p), ("iov_len", c_size_t)]
+
+
+class MsgHdr(Structure):
+    _fields_ = [
+        ("msg_name", c_void_p),
+        ("msg_namelen", c_uint),
+        ("msg_iov", POINTER(IOVec)),
+        ("msg_iovlen", c_size_t),
+        ("msg_control", c_void_p),
+        ("msg_controllen", c_size_t),
+        ("msg_flags", c_int),
+    ]
+
+
+class MMsgHdr(Structure):
+    _fields_ = [("msg_hdr", MsgHdr), ("msg_len", c_uint)]
+
+
+class CMsgHdr(Structure):
+    _fields_ = [("cmsg_len", c_size_t), ("cmsg_level", c_int), ("cmsg_type", c_int)]
+
+
+class FrameBuffer:
+    """Preallocated buffer to receive multiple frames at once.
+
+    Frames are received into the rest of the buffer by ``recvmmsg(2)``
+    in a single system call if it is available (Linux). Otherwise they
+    are received one by one. The received frames are written to a file
+    at once (i.e. a single ``write(2)`` or ``writev(2)`` system call)
+    when the buffer is flushed (e.g. when it is full). If ``SO_RXQ_OVFL``
+    is enabled on the socket, the number of frames dropped by the kernel
+    since the last receive is accumulated in ``n_dropped``.
+
+    Args:
+        n_frames: Maximum number of frames received at once.
+        frame_bytes: Maximum byte size of each frame.
+
+    """
+
+    def __init__(self, n_frames: int, frame_bytes: int, /) -> None:
+        self.n_frames = n_frames
+        self.n_filled = 0
+        self.n_dropped = 0
+        self.drop_count = 0
+        self.frame_bytes = frame_bytes
+        self.sizes = [0] * n_frames
+        self.data = (c_char * (n_frames * frame_bytes))()
+        self.view = memoryview(self.data).cast("B")
+        self.iovecs = (IOVec * n_frames)()
+        self.msgvec = (MMsgHdr * n_frames)()
+        self.controls = (c_char * (n_frames * CONTROL_BYTES))()
+
+        for index in range(n_frames):
+            self.iovecs[index].iov_base = addressof(self.data) + index * frame_bytes
+            self.iovecs[index].iov_len = frame_bytes
+            self.msgvec[index].msg_hdr.msg_iov = pointer(self.iovecs[index])
+            self.msgvec[index].msg_hdr.msg_iovlen = 1
+            self.msgvec[index].msg_hdr.msg_control = (
+                addressof(self.controls) + index * CONTROL_BYTES
+            )
+            self.msgvec[index].msg_hdr.msg_controllen = CONTROL_BYTES
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the buffer is filled with received frames."""
+        return self.n_filled == self.n_frames
+
+    def flush(self, file: BinaryIO, /) -> int:
+        """Write the received complete frames to a file and empty the buffer.
+
+        Args:
+            file: Unbuffered binary file to which the frames are written.
+
+        Returns:
+            Number of the written frames. Truncated frames are not written.
+
+        """
+        n_frames, self.n_filled = self.n_filled, 0
+        sizes = self.sizes[:n_frames]
+
+        if all(size == self.frame_bytes for size in sizes):
+            file.write(self.view[: n_frames * self.frame_bytes])
+            return n_frames
+
+        frames = [
+            self.view[index * size : index * size + size]
+            for index, size in enumerate(sizes)
+            if size == self.frame_bytes
+        ]
+
+        if frames and writev is not None:
+            writev(file.fileno(), frames)
+        else:
+            for frame in frames:
+                file.write(frame)
+
+        return len(frames)
+
+    def recv(self, sock: socket, /) -> int:
+        """Receive frame(s) from a socket into the rest of the buffer.
+
+        Args:
+            sock: Socket from which the frame(s) are received.
+
+        Returns:
+            Number of the received frame(s). Zero if no frame
+            is available on the (non-blocking) socket.
+
+        """
+        start = self.n_filled
+
+        if RECVMMSG is None:
+            try:
+                offset = start * self.frame_bytes
+                size, ancdata, _, _ = sock.recvmsg_into(
+                    [self.view[offset : offset + self.frame_bytes]],
+                    CONTROL_BYTES,
+                )
+            except BlockingIOError:
+                return 0
+
+            for cmsg_level, cmsg_type, cmsg_data in ancdata:
+                if cmsg_level == SOL_SOCKET and cmsg_type == SO_RXQ_OVFL:
+                    self.count_dropped(int.from_bytes(cmsg_data[:4], byteorder))
+
+            self.sizes[start] = size
+            self.n_filled += 1
+            return 1
+
+        n_frames = RECVMMSG(
+            sock.fileno(),
+            byref(self.msgvec[start]),
+            self.n_frames - start,
+            MSG_WAITFORONE,
+            None,
+        )
+
+        if n_frames < 0:
+            if (errno := get_errno()) in (EAGAIN, EINTR):
+                return 0
+
+            raise OSError(errno, strerror(errno))
+
+        for index in range(start, start + n_frames):
+            self.sizes[index] = self.msgvec[index].msg_len
+            header = self.msgvec[index].msg_hdr
+
+            if header.msg_controllen:
+                address = addressof(self.controls) + index * CONTROL_BYTES
+                cmsg = CMsgHdr.from_address(address)
+
+                if cmsg.cmsg_level == SOL_SOCKET and cmsg.cmsg_type == SO_RXQ_OVFL:
+                    data = c_uint32.from_address(address + sizeof(CMsgHdr))
+                    self.count_dropped(data.value)
+
+            # msg_controllen is overwritten by the kernel (0 if no cmsg)
+            header.msg_controllen = CONTROL_BYTES
+
+        self.n_filled += n_frames
+        return n_frames
+
+    def count_dropped(self, drop_count: int, /) -> None:
+        """Accumulate dropped frames from a socket's drop counter."""
+        self.n_dropped += (drop_count - self.drop_count) % 2**32
+        self.drop_count = drop_count
+
+
+def get_numa_cpus(nic: str, /) -> list[int]:
+    """Return the CPU numbers on the same NUMA node as a NIC.
+
+    Args:
+        nic: Name of the network interface (e.g. eth0).
+
+    Returns:
+        List of the CPU numbers. If the NUMA node of the NIC
+        is unknown, all CPU numbers will be returned instead.
+
+    """
+    try:
+        node = int(Path(f"/sys/class/net/{nic}/device/numa_node").read_text())
+    except FileNotFoundError:
+        node = -1
+
+    if node < 0:
+        return list(range(cpu_count() or 1))
+
+    cpus: list[int] = []
+    cpulist = Path(f"/sys/devices/system/node/node{node}/cpulist").read_text()
+
+    for cpu_range in cpulist.strip().split(","):
+        start, _, stop = cpu_range.partition("-")
+        cpus.extend(range(int(start), int(stop or start) + 1))
+
+    return cpus
+
+
+def load_recvmmsg() -> Any:
+    """Load recvmmsg(2) from the C library if available."""
+    try:
+        recvmmsg = CDLL(None, use_errno=True).recvmmsg
+    except (AttributeError, OSError, TypeError):  # TypeError on Windows
+        return None
+
+    recvmmsg.argtypes = [c_int, POINTER(MMsgHdr), c_uint, c_int, c_void_p]
+    recvmmsg.restype = c_int
+    return recvmmsg
+
+
+RECVMMSG = load_recvmmsg()
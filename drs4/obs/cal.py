@@ -1,6 +1,7 @@
 __all__ = ["yfactor"]
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # dependencies
@@ -18,6 +19,7 @@ COLOR_OTHER = "#4f455c"  # https://www.colordic.org/colorsample/2295
 DRS4_BINARY_POINT = 15
 DRS4_INTNUM = 2000000
 DRS4_NFFT = 1024
+DRS4_SCALE = 2**DRS4_BINARY_POINT / DRS4_INTNUM / DRS4_NFFT**2
 
 
 def yfactor(
@@ -51,58 +53,42 @@ def yfactor(
             zarr_if2_cold=zarr_if2_cold,
         )
 
-    if1_hot = xr.open_zarr(zarr_if1_hot)
-    if2_hot = xr.open_zarr(zarr_if2_hot)
-    if1_cold = xr.open_zarr(zarr_if1_cold)
-    if2_cold = xr.open_zarr(zarr_if2_cold)
+    def load(zarr: StrPath, /) -> xr.Dataset:
+        ds = xr.open_zarr(zarr)[["auto_lsb", "auto_usb"]]
+        return ds.mean("time", keep_attrs=True).compute()
+
+    # load only the time-averaged auto-correlations of the four stores concurrently
+    with ThreadPoolExecutor(4) as executor:
+        if1_hot, if2_hot, if1_cold, if2_cold = executor.map(
+            load,
+            (zarr_if1_hot, zarr_if2_hot, zarr_if1_cold, zarr_if2_cold),
+        )
+
+    # convert each averaged spectrum to dB only once
+    if1_hot_lsb = to_dB_spectrum(if1_hot, "auto_lsb")
+    if1_hot_usb = to_dB_spectrum(if1_hot, "auto_usb")
+    if2_hot_lsb = to_dB_spectrum(if2_hot, "auto_lsb")
+    if2_hot_usb = to_dB_spectrum(if2_hot, "auto_usb")
+    if1_cold_lsb = to_dB_spectrum(if1_cold, "auto_lsb")
+    if1_cold_usb = to_dB_spectrum(if1_cold, "auto_usb")
+    if2_cold_lsb = to_dB_spectrum(if2_cold, "auto_lsb")
+    if2_cold_usb = to_dB_spectrum(if2_cold, "auto_usb")
 
     fig, axes = plt.subplots(2, 2, figsize=figsize, sharex=True)
 
     ax = axes[0, 0]
-    (
-        to_dB(if1_hot["auto_lsb"].mean("time"), if1_hot.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_HOT, label="Hot")
-    )
-    (
-        to_dB(if1_cold["auto_lsb"].mean("time"), if1_cold.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_COLD, label="Cold")
-    )
-    (
-        to_dB(if2_hot["auto_lsb"].mean("time"), if2_hot.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_HOT)
-    )
-    (
-        to_dB(if2_cold["auto_lsb"].mean("time"), if2_cold.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_COLD)
-    )
+    if1_hot_lsb.plot.step(ax=ax, color=COLOR_HOT, label="Hot")
+    if1_cold_lsb.plot.step(ax=ax, color=COLOR_COLD, label="Cold")
+    if2_hot_lsb.plot.step(ax=ax, color=COLOR_HOT)
+    if2_cold_lsb.plot.step(ax=ax, color=COLOR_COLD)
     ax.set_title(f"Chassis {chassis}, LSB")
     ax.set_ylabel("Power [dB]")
 
     ax = axes[0, 1]
-    (
-        to_dB(if1_hot["auto_usb"].mean("time"), if1_hot.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_HOT, label="Hot")
-    )
-    (
-        to_dB(if1_cold["auto_usb"].mean("time"), if1_cold.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_COLD, label="Cold")
-    )
-    (
-        to_dB(if2_hot["auto_usb"].mean("time"), if2_hot.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_HOT)
-    )
-    (
-        to_dB(if2_cold["auto_usb"].mean("time"), if2_cold.integ_time)
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_COLD)
-    )
+    if1_hot_usb.plot.step(ax=ax, color=COLOR_HOT, label="Hot")
+    if1_cold_usb.plot.step(ax=ax, color=COLOR_COLD, label="Cold")
+    if2_hot_usb.plot.step(ax=ax, color=COLOR_HOT)
+    if2_cold_usb.plot.step(ax=ax, color=COLOR_COLD)
     ax.set_title(f"Chassis {chassis}, USB")
     ax.set_ylabel(None)
 
@@ -113,41 +99,13 @@ def yfactor(
         ax.set_ylim(-60, -30)
 
     ax = axes[1, 0]
-    (
-        (
-            to_dB(if1_hot["auto_lsb"].mean("time"), if1_hot.integ_time)
-            - to_dB(if1_cold["auto_lsb"].mean("time"), if1_cold.integ_time)
-        )
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_OTHER)
-    )
-    (
-        (
-            to_dB(if2_hot["auto_lsb"].mean("time"), if2_hot.integ_time)
-            - to_dB(if2_cold["auto_lsb"].mean("time"), if2_cold.integ_time)
-        )
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_OTHER)
-    )
+    (if1_hot_lsb - if1_cold_lsb).plot.step(ax=ax, color=COLOR_OTHER)
+    (if2_hot_lsb - if2_cold_lsb).plot.step(ax=ax, color=COLOR_OTHER)
     ax.set_ylabel("Y factor [dB]")
 
     ax = axes[1, 1]
-    (
-        (
-            to_dB(if1_hot["auto_usb"].mean("time"), if1_hot.integ_time)
-            - to_dB(if1_cold["auto_usb"].mean("time"), if1_cold.integ_time)
-        )
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_OTHER)
-    )
-    (
-        (
-            to_dB(if2_hot["auto_usb"].mean("time"), if2_hot.integ_time)
-            - to_dB(if2_cold["auto_usb"].mean("time"), if2_cold.integ_time)
-        )
-        .swap_dims(chan="freq")
-        .plot.step(ax=ax, color=COLOR_OTHER)
-    )
+    (if1_hot_usb - if1_cold_usb).plot.step(ax=ax, color=COLOR_OTHER)
+    (if2_hot_usb - if2_cold_usb).plot.step(ax=ax, color=COLOR_OTHER)
     ax.set_ylabel(None)
 
     for ax in axes[1]:
@@ -162,10 +120,10 @@ def yfactor(
 
 def to_dB(da: xr.DataArray, integ_time: int, /) -> xr.DataArray:
     """Convert power scale to dB scale."""
-    return 10 * np.log10(
-        (da + 2**-40)
-        * 2**DRS4_BINARY_POINT
-        / DRS4_INTNUM
-        / DRS4_NFFT**2
-        / int(integ_time / 100)
-    )
+    scale = DRS4_SCALE / int(integ_time / 100)
+    return 10 * np.log10((da + 2**-40) * scale)
+
+
+def to_dB_spectrum(ds: xr.Dataset, name: str, /) -> xr.DataArray:
+    """Convert a time-averaged spectrum to dB scale along frequency."""
+    return to_dB(ds[name], ds.integ_time).swap_dims(chan="freq")
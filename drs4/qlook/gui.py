@@ -14,7 +14,7 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from PIL import Image
 from ..specs.common import ENV_CTRL_ADDR, ENV_CTRL_USER, Chassis
-from ..utils import StrPath, set_workdir
+from ..utils import SSH_OPTIONS, StrPath, set_workdir
 
 # constants
 IMAGE_DIR = "~/DRS4"
@@ -71,32 +71,46 @@ def run(
         fig, axes = plt.subplots(2, 3, figsize=figsize)
         fig.subplots_adjust()
 
+        images = {
+            axes[0, 0]: workdir / IMAGE_00,
+            axes[0, 1]: workdir / IMAGE_01,
+            axes[0, 2]: workdir / IMAGE_02,
+            axes[1, 0]: workdir / IMAGE_10,
+            axes[1, 1]: workdir / IMAGE_11,
+            axes[1, 2]: workdir / IMAGE_12,
+        }
+        mtimes: dict[Path, float] = {}
+
         def plot(frame: int, /) -> None:
             sprun(
-                f"scp -p '{ctrl_user}@{ctrl_addr}:{IMAGE_DIR}/*.jpg' {workdir}",
+                [
+                    "scp",
+                    "-p",
+                    *SSH_OPTIONS,
+                    f"{ctrl_user}@{ctrl_addr}:{IMAGE_DIR}/*.jpg",
+                    str(workdir),
+                ],
                 stdout=PIPE,
                 stderr=PIPE,
-                shell=True,
                 timeout=timeout,
             )
 
-            for ax in axes.flatten():
-                ax.cla()
-
-            axes[0, 0].imshow(Image.open(workdir / IMAGE_00))
-            axes[0, 1].imshow(Image.open(workdir / IMAGE_01))
-            axes[0, 2].imshow(Image.open(workdir / IMAGE_02))
-            axes[1, 0].imshow(Image.open(workdir / IMAGE_10))
-            axes[1, 1].imshow(Image.open(workdir / IMAGE_11))
-            axes[1, 2].imshow(Image.open(workdir / IMAGE_12))
-
-            axes[0, 0].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_00)}")
-            axes[0, 1].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_01)}")
-            axes[0, 2].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_02)}")
-            axes[1, 0].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_10)}")
-            axes[1, 1].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_11)}")
-            axes[1, 2].set_xlabel(f"Last Updated: {mtime(workdir / IMAGE_12)}")
+            for ax, image in images.items():
+                # skip the image if not updated (scp -p keeps modified times)
+                if mtimes.get(image) == (modified := getmtime(image)):
+                    continue
+
+                mtimes[image] = modified
+
+                with Image.open(image) as data:
+                    if artists := ax.get_images():
+                        artists[0].set_data(data)
+                    else:
+                        ax.imshow(data)
+
+                ax.set_xlabel(f"Last Updated: {mtime(image)}")
 
+        def decorate() -> None:
             axes[0, 1].text(0, 55, "Bit Distribution (Port 1)", fontsize=15)
             axes[0, 2].text(0, 55, "Bit Distribution (Port 2)", fontsize=15)
             axes[1, 1].text(0, 55, "Bit Distribution (Port 3)", fontsize=15)
@@ -111,6 +125,7 @@ def run(
 
         try:
             plot(-1)
+            decorate()
             fig.tight_layout()
 
             animation = FuncAnimation(  # type: ignore
@@ -7,8 +7,16 @@ __all__ = [
     "Interface",
     "IntegTime",
     "SideBand",
+    # constants (type hint values)
+    "CHASSIS_VALUES",
+    "DSP_MODE_VALUES",
+    "FREQ_RANGE_VALUES",
+    "INTERFACE_VALUES",
+    "INTEG_TIME_VALUES",
+    "SIDE_BAND_VALUES",
     # constants (data formats)
     "CHAN_TOTAL",
+    "CHAN_RANGE",
     "FREQ_INTERVAL",
     "FREQ_INNER",
     "FREQ_OUTER",
@@ -17,8 +25,10 @@ __all__ = [
     "CSV_CROSS_FORMAT",
     "OBSID_FORMAT",
     "VDIF_FORMAT",
+    "ZARR_COMPRESSOR",
     "ZARR_ENCODING",
     "ZARR_FORMAT",
+    "ZARR_TIME_CHUNK",
     # constants (environment variables)
     "ENV_CTRL_ADDR",
     "ENV_CTRL_USER",
@@ -43,11 +53,12 @@ __all__ = [
 
 # standard library
 from dataclasses import dataclass
-from typing import Literal as L
+from typing import Literal as L, get_args
 
 # dependencies
 import numpy as np
 from xarray_dataclasses import Attr, Data
+from zarr import Blosc
 
 # type hints
 Channel = int
@@ -59,11 +70,23 @@ IntegTime = L[100, 200, 500, 1000]  # ms
 SideBand = L["USB", "LSB"]
 
 
+# constants (type hint values)
+CHASSIS_VALUES: tuple[Chassis, ...] = get_args(Chassis)
+DSP_MODE_VALUES: tuple[DSPMode, ...] = get_args(DSPMode)
+FREQ_RANGE_VALUES: tuple[FreqRange, ...] = get_args(FreqRange)
+INTERFACE_VALUES: tuple[Interface, ...] = get_args(Interface)
+INTEG_TIME_VALUES: tuple[IntegTime, ...] = get_args(IntegTime)
+SIDE_BAND_VALUES: tuple[SideBand, ...] = get_args(SideBand)
+
 # constants (data formats)
 CHAN_TOTAL = 512  # ch
+CHAN_RANGE = np.arange(CHAN_TOTAL)  # ch
 FREQ_INTERVAL = 0.02  # GHz
 FREQ_INNER = FREQ_INTERVAL * np.arange(CHAN_TOTAL * 0, CHAN_TOTAL * 1)  # GHz
 FREQ_OUTER = FREQ_INTERVAL * (np.arange(CHAN_TOTAL * 1, CHAN_TOTAL * 2) + 1)  # GHz
+CHAN_RANGE.setflags(write=False)  # shared (not copied) by datasets
+FREQ_INNER.setflags(write=False)  # shared (not copied) by datasets
+FREQ_OUTER.setflags(write=False)  # shared (not copied) by datasets
 
 
 # constants (file formats)
@@ -71,11 +94,13 @@ CSV_AUTOS_FORMAT = "drs4-{0}-chassis{1}-autos-if{2}.csv"
 CSV_CROSS_FORMAT = "drs4-{0}-chassis{1}-cross-if{2}.csv"
 OBSID_FORMAT = "%Y%m%dT%H%M%SZ"
 VDIF_FORMAT = "drs4-{0}-chassis{1}-in{2}.vdif"
+ZARR_COMPRESSOR = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
+ZARR_TIME_CHUNK = 1000  # max samples per chunk along time
 ZARR_ENCODING = {
-    "time": {
-        "dtype": "int64",
-        "units": "nanoseconds since 2000-01-01",
-    }
+    "time": {"dtype": "int64", "units": "nanoseconds since 2000-01-01"},
+    "auto_usb": {"compressor": ZARR_COMPRESSOR},
+    "auto_lsb": {"compressor": ZARR_COMPRESSOR},
+    "cross_2sb": {"compressor": ZARR_COMPRESSOR},
 }
 ZARR_FORMAT = "drs4-{0}-chassis{1}-if{2}.zarr.zip"
 
@@ -8,8 +8,9 @@ from dataclasses import dataclass, field
 import numpy as np
 import pandas as pd
 import xarray as xr
+from numpy.typing import NDArray
 from xarray_dataclasses import AsDataset, Attr, Coordof, Dataof
-from .common import Time, Chan, AutoUSB, AutoLSB, Cross2SB
+from .common import CHAN_RANGE, Time, Chan, AutoUSB, AutoLSB, Cross2SB
 from ..utils import StrPath
 
 # constants
@@ -77,18 +78,15 @@ def open_csv_autos(csv: StrPath, /) -> xr.Dataset:
         Dataset of the input CSV file.
 
     """
-    try:
-        df = pd.read_csv(csv, parse_dates=[COL_TIME])
-    except ValueError:
-        df = pd.read_csv(csv).assign(time=TIME_DEFAULT)
+    df = read_csv(csv)
 
-    ds = df.set_index([COL_TIME, COL_FREQ]).to_xarray()
+    time, (auto_usb, auto_lsb) = to_grid(df, COL_USB, COL_LSB)
 
     return CSVAutos.new(
-        time=ds[COL_TIME].data,
-        chan=np.arange(ds.sizes[COL_FREQ]),
-        auto_usb=ds[COL_USB].data,
-        auto_lsb=ds[COL_LSB].data,
+        time=time,
+        chan=CHAN_RANGE[: auto_usb.shape[1]],
+        auto_usb=auto_usb,
+        auto_lsb=auto_lsb,
     )
 
 
@@ -102,15 +100,88 @@ def open_csv_cross(csv: StrPath, /) -> xr.Dataset:
         Dataset of the input CSV file.
 
     """
-    try:
-        df = pd.read_csv(csv, parse_dates=[COL_TIME])
-    except ValueError:
-        df = pd.read_csv(csv).assign(time=TIME_DEFAULT)
+    df = read_csv(csv)
 
-    ds = df.set_index([COL_TIME, COL_FREQ]).to_xarray()
+    time, (real, imag) = to_grid(df, COL_REAL, COL_IMAG)
 
     return CSVCross.new(
-        time=ds[COL_TIME].data,
-        chan=np.arange(ds.sizes[COL_FREQ]),
-        cross_2sb=(ds[COL_REAL] + ds[COL_IMAG] * 1j).data,
+        time=time,
+        chan=CHAN_RANGE[: real.shape[1]],
+        cross_2sb=real + imag * 1j,
     )
+
+
+def read_csv(csv: StrPath, /) -> pd.DataFrame:
+    """Read a CSV file as a DataFrame with a time column.
+
+    The file is parsed only once. If the time column is missing
+    (e.g. legacy CSV files), it is filled with ``TIME_DEFAULT``.
+
+    """
+    df = pd.read_csv(csv)
+
+    if COL_TIME in df:
+        # any ISO 8601 variant (e.g. without fractional seconds) is accepted
+        df[COL_TIME] = pd.to_datetime(df[COL_TIME], format="ISO8601")
+    else:
+        df = df.assign(time=TIME_DEFAULT)
+
+    return df
+
+
+def to_grid(
+    df: pd.DataFrame,
+    /,
+    *columns: str,
+) -> tuple[NDArray[np.datetime64], list[NDArray[np.float64]]]:
+    """Convert columns of a DataFrame to (time, freq) arrays.
+
+    If rows are already ordered by time and then by frequency without gaps,
+    the columns are simply reshaped. Otherwise rows are scattered onto
+    the grid of sorted unique time and frequency, where missing
+    combinations are filled with NaN.
+
+    Args:
+        df: DataFrame of a CSV file.
+        columns: Names of the columns to be converted.
+
+    Returns:
+        Sorted unique time and the converted arrays.
+
+    """
+    if (shape := regular_shape(df)) is not None:
+        time = df[COL_TIME].to_numpy()[:: shape[1]]
+        return time, [df[column].to_numpy().reshape(shape) for column in columns]
+
+    time_index, time = pd.factorize(df[COL_TIME], sort=True)
+    freq_index, freq = pd.factorize(df[COL_FREQ], sort=True)
+    arrays: list[NDArray[np.float64]] = []
+
+    for column in columns:
+        array = np.full((len(time), len(freq)), np.nan)
+        array[time_index, freq_index] = df[column].to_numpy()
+        arrays.append(array)
+
+    return time.to_numpy(), arrays
+
+
+def regular_shape(df: pd.DataFrame, /) -> tuple[int, int] | None:
+    """Return the (time, freq) shape if rows are on a regular grid."""
+    time = df[COL_TIME].to_numpy()
+    freq = df[COL_FREQ].to_numpy()
+
+    if not len(df) or len(df) % (n_freq := np.count_nonzero(time == time[0])):
+        return None
+
+    time = time.reshape(-1, n_freq)
+    freq = freq.reshape(-1, n_freq)
+
+    if not (
+        (time == time[:, :1]).all()
+        and (freq == freq[:1]).all()
+        and (time[1:, 0] > time[:-1, 0]).all()
+        and (freq[0, 1:] > freq[0, :-1]).all()
+    ):
+        return None
+
+    return time.shape
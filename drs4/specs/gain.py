@@ -3,16 +3,23 @@ __all__ = ["GAIN_ONES", "GAIN_ZEROS", "Gain", "open_gain"]
 
 # standard library
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Literal as L, overload
 
 # dependencies
 import numpy as np
 import pandas as pd
 import xarray as xr
+from numpy.typing import NDArray
 from xarray_dataclasses import AsDataset, Attr, Coordof, Data, Dataof
-from .common import CHAN_TOTAL, Chan
+from .common import CHAN_RANGE, CHAN_TOTAL, Chan
 from ..utils import StrPath
 
+# constants
+HEX_DIGITS = np.frombuffer(b"0123456789abcdef", np.uint8)
+HEX_PREFIX = np.frombuffer(b"0x", np.uint8)
+HEX_SHIFTS = np.arange(28, -1, -4, dtype=np.uint32)
+
 
 @dataclass
 class GainUSB:
@@ -93,16 +100,24 @@ def open_gain(
         raise ValueError("Output data format must be DataFrame|Dataset.")
 
     ds = xr.open_zarr(ms)
-    masked = ds.where(ds.chan == ds.signal_chan)
-    masked_usb = masked.where(masked.signal_sb == "USB", drop=True)
-    masked_lsb = masked.where(masked.signal_sb == "LSB", drop=True)
-    gain_usb = -(masked_usb.cross_2sb / masked_usb.auto_usb).conj()
-    gain_lsb = -(masked_lsb.cross_2sb / masked_lsb.auto_lsb)
+    chan = ds.indexes["chan"].get_indexer(ds.signal_chan.values)
+    signal_sb = ds.signal_sb.values
+    time = np.flatnonzero(chan >= 0)
+
+    # select only the signal channel of each time (one element per row)
+    signal = ds[["auto_usb", "auto_lsb", "cross_2sb"]].isel(
+        time=xr.DataArray(time, dims="time"),
+        chan=xr.DataArray(chan[time], dims="time"),
+    )
+    gain_usb = -(signal.cross_2sb / signal.auto_usb).values.conj()
+    gain_lsb = -(signal.cross_2sb / signal.auto_lsb).values
+    is_usb = signal_sb[time] == "USB"
+    is_lsb = signal_sb[time] == "LSB"
 
     gain = Gain.new(
         chan=ds.chan.data,
-        usb=gain_usb.mean("time").fillna(0).data,
-        lsb=gain_lsb.mean("time").fillna(0).data,
+        usb=mean_by_chan(gain_usb[is_usb], chan[time][is_usb], ds.sizes["chan"]),
+        lsb=mean_by_chan(gain_lsb[is_lsb], chan[time][is_lsb], ds.sizes["chan"]),
     )
 
     if format == "Dataset":
@@ -111,30 +126,72 @@ def open_gain(
         return to_dataframe(gain)
 
 
+def mean_by_chan(
+    values: NDArray[np.complex128],
+    chan: NDArray[np.int_],
+    n_chan: int,
+    /,
+) -> NDArray[np.complex128]:
+    """Average values by channel index, ignoring NaN (0 if no values)."""
+    is_valid = ~np.isnan(values)
+    values, chan = values[is_valid], chan[is_valid]
+    count = np.bincount(chan, minlength=n_chan)
+    real = np.bincount(chan, values.real, minlength=n_chan)
+    imag = np.bincount(chan, values.imag, minlength=n_chan)
+
+    with np.errstate(invalid="ignore"):
+        return np.where(count > 0, (real + imag * 1j) / count, 0)
+
+
 def to_dataframe(gain: xr.Dataset, /) -> pd.DataFrame:
     """Convert a gain Dataset to DataFrame for a coefficient table."""
-    coef_re0 = (gain.usb.real * 8192).astype(int) & 0xFFFFFFFF
-    coef_im0 = (gain.usb.imag * 8192).astype(int) & 0xFFFFFFFF
-    coef_re1 = (gain.lsb.real * 8192).astype(int) & 0xFFFFFFFF
-    coef_im1 = (gain.lsb.imag * 8192).astype(int) & 0xFFFFFFFF
+    usb, lsb = gain.usb.data, gain.lsb.data
+    coefs = (np.stack((usb.real, usb.imag, lsb.real, lsb.imag)) * 8192).astype(int)
+    coef_re0, coef_im0, coef_re1, coef_im1 = to_hex(coefs & 0xFFFFFFFF)
 
     return pd.DataFrame(
         data={
-            "coef_re0": coef_re0.to_series().map("{:#010x}".format).values,
-            "coef_im0": coef_im0.to_series().map("{:#010x}".format).values,
-            "coef_re1": coef_re1.to_series().map("{:#010x}".format).values,
-            "coef_im1": coef_im1.to_series().map("{:#010x}".format).values,
+            "coef_re0": coef_re0,
+            "coef_im0": coef_im0,
+            "coef_re1": coef_re1,
+            "coef_im1": coef_im1,
         }
     )
 
 
+def to_hex(array: NDArray[np.int_], /) -> NDArray[np.str_]:
+    """Format 32-bit unsigned integers as hex strings (0x%08x)."""
+    digits = (array.astype(np.uint32)[..., None] >> HEX_SHIFTS) & 0xF
+    chars = np.empty((*array.shape, 10), np.uint8)
+    chars[..., :2] = HEX_PREFIX
+    chars[..., 2:] = HEX_DIGITS[digits]
+    return chars.view("S10")[..., 0].astype(str)
+
+
+def to_csv(gain: xr.Dataset, /) -> str:
+    """Convert a gain Dataset to CSV text for a coefficient table."""
+    df = to_dataframe(gain)
+    rows = np.column_stack((df.index.astype(str), df.to_numpy(str)))
+
+    with StringIO() as buffer:
+        np.savetxt(
+            buffer,
+            rows,
+            fmt="%s",
+            delimiter=",",
+            header=",".join(("", *df.columns)),
+            comments="",
+        )
+        return buffer.getvalue()
+
+
 GAIN_ONES = Gain.new(
-    chan=np.arange(CHAN_TOTAL),
+    chan=CHAN_RANGE,
     usb=np.ones(CHAN_TOTAL),
     lsb=np.ones(CHAN_TOTAL),
 )
 GAIN_ZEROS = Gain.new(
-    chan=np.arange(CHAN_TOTAL),
+    chan=CHAN_RANGE,
     usb=np.zeros(CHAN_TOTAL),
     lsb=np.zeros(CHAN_TOTAL),
 )
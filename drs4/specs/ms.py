@@ -1,17 +1,24 @@
-__all__ = ["MS", "open_csvs", "open_vdifs"]
+__all__ = ["MS", "open_csvs", "open_vdifs", "to_zarrs"]
 
 
 # standard library
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Literal as L, get_args
+from pathlib import Path
+from typing import Literal as L
 
 # dependencies
 import numpy as np
 import xarray as xr
+from numpy.typing import NDArray
 from xarray_dataclasses import AsDataset, Attr, Coordof, Data, Dataof
 from .common import (
+    CHASSIS_VALUES,
     FREQ_INNER,
     FREQ_OUTER,
+    FREQ_RANGE_VALUES,
+    INTEG_TIME_VALUES,
+    INTERFACE_VALUES,
     Channel,
     Chassis,
     FreqRange,
@@ -19,6 +26,8 @@ from .common import (
     IntegTime,
     SideBand,
     Time,
+    ZARR_ENCODING,
+    ZARR_TIME_CHUNK,
     Chan,
     AutoUSB,
     AutoLSB,
@@ -26,7 +35,14 @@ from .common import (
 )
 from .csv import open_csv_autos, open_csv_cross
 from .vdif import open_vdif
-from ..utils import StrPath, XarrayJoin
+from ..utils import StrPath, XarrayJoin, unique
+
+# constants
+FREQ_BY_RANGE: dict[FreqRange, NDArray[np.float64]] = {
+    "inner": FREQ_INNER,
+    "outer": np.ascontiguousarray(FREQ_OUTER[::-1]),
+}
+FREQ_BY_RANGE["outer"].setflags(write=False)  # shared (not copied) by datasets
 
 
 # data classes
@@ -126,44 +142,48 @@ def open_csvs(
         join: Method for joining the CSV files.
 
     Returns:
-        Dataset of the input CSV files.
+        Dataset of the input CSV files. Its signal_sb and signal_chan
+        are read-only (broadcast) arrays; copy them before modifying.
 
     Raises:
         ValueError: Raised if the given value of either chassis, freq_range,
             integ_time, or interface is not valid.
 
     """
-    if chassis not in get_args(Chassis):
+    if chassis not in CHASSIS_VALUES:
         raise ValueError("Chassis number must be 1|2.")
 
-    if interface not in get_args(Interface):
+    if interface not in INTERFACE_VALUES:
         raise ValueError("Interface number must be 1|2.")
 
-    if freq_range not in get_args(FreqRange):
+    if freq_range not in FREQ_RANGE_VALUES:
         raise ValueError("Spectral integration time must be inner|outer.")
 
-    if integ_time not in get_args(IntegTime):
+    if integ_time not in INTEG_TIME_VALUES:
         raise ValueError("Spectral integration time must be 100|200|500|1000.")
 
-    ds_autos, ds_cross = xr.align(
-        open_csv_autos(csv_autos),
-        open_csv_cross(csv_cross),
-        join=join,
-    )
+    ds_autos = open_csv_autos(csv_autos)
+    ds_cross = open_csv_cross(csv_cross)
+
+    # autos/cross rows are usually written in the same cycles
+    if not all(
+        ds_autos.indexes[dim].equals(ds_cross.indexes[dim]) for dim in ("time", "chan")
+    ):
+        ds_autos, ds_cross = xr.align(ds_autos, ds_cross, join=join)
 
     return MS.new(
         # dims
         time=ds_autos.time.data,
         chan=ds_autos.chan.data,
         # coords
-        freq=FREQ_INNER if freq_range == "inner" else FREQ_OUTER[::-1],
-        signal_sb=np.full(
+        freq=FREQ_BY_RANGE[freq_range],
+        signal_sb=np.broadcast_to(
+            np.array(signal_sb if signal_sb is not None else "NA", "U3"),
             ds_autos.sizes["time"],
-            signal_sb if signal_sb is not None else "NA",
         ),
-        signal_chan=np.full(
+        signal_chan=np.broadcast_to(
+            np.array(signal_chan if signal_chan is not None else -1, np.int64),
             ds_autos.sizes["time"],
-            signal_chan if signal_chan is not None else -1,
         ),
         # vars
         auto_usb=ds_autos.auto_usb.data,
@@ -206,10 +226,12 @@ def open_vdifs(
             If not specified, NA (missing indicator) will be assigned.
         signal_chan: Signal channel number (0-511).
             If not specified, -1 (missing indicator) will be assigned.
-        join: Method for joining the VDIF files.
+        join: Method for joining the VDIF files. It is also used for
+            joining the first- and second-half spectra in each file.
 
     Returns:
-        Dataset of the input VDIF files.
+        Dataset of the input VDIF files. Its signal_sb and signal_chan
+        are read-only (broadcast) arrays; copy them before modifying.
 
     Raises:
         RuntimeError: Raised if USB/LSB spectral integration times are not same.
@@ -217,20 +239,29 @@ def open_vdifs(
             integ_time, or interface is not valid.
 
     """
-    if chassis not in get_args(Chassis):
+    if chassis not in CHASSIS_VALUES:
         raise ValueError("Chassis number must be 1|2.")
 
-    if interface not in get_args(Interface):
+    if interface not in INTERFACE_VALUES:
         raise ValueError("Interface number must be 1|2.")
 
-    if freq_range not in get_args(FreqRange):
+    if freq_range not in FREQ_RANGE_VALUES:
         raise ValueError("Spectral integration time must be inner|outer.")
 
-    da_usb, da_lsb = xr.align(
-        open_vdif(vdif_usb, integ_time=integ_time, join=join),
-        open_vdif(vdif_lsb, integ_time=integ_time, join=join),
-        join=join,
-    )
+    with ThreadPoolExecutor(2) as executor:
+        future_usb = executor.submit(
+            open_vdif, vdif_usb, integ_time=integ_time, join=join
+        )
+        future_lsb = executor.submit(
+            open_vdif, vdif_lsb, integ_time=integ_time, join=join
+        )
+        da_usb, da_lsb = future_usb.result(), future_lsb.result()
+
+    # USB/LSB frames are usually recorded in lockstep
+    if not all(
+        da_usb.indexes[dim].equals(da_lsb.indexes[dim]) for dim in ("time", "chan")
+    ):
+        da_usb, da_lsb = xr.align(da_usb, da_lsb, join=join)
 
     if da_usb.integ_time != da_lsb.integ_time:
         raise RuntimeError("USB/LSB spectral integration times must be same.")
@@ -240,21 +271,87 @@ def open_vdifs(
         time=da_usb.time.data,
         chan=da_usb.chan.data,
         # coords
-        freq=FREQ_INNER if freq_range == "inner" else FREQ_OUTER[::-1],
-        signal_sb=np.full(
+        freq=FREQ_BY_RANGE[freq_range],
+        signal_sb=np.broadcast_to(
+            np.array(signal_sb if signal_sb is not None else "NA", "U3"),
             da_usb.sizes["time"],
-            signal_sb if signal_sb is not None else "NA",
         ),
-        signal_chan=np.full(
+        signal_chan=np.broadcast_to(
+            np.array(signal_chan if signal_chan is not None else -1, np.int64),
             da_usb.sizes["time"],
-            signal_chan if signal_chan is not None else -1,
         ),
         # vars
         auto_usb=da_usb.data,
         auto_lsb=da_lsb.data,
-        cross_2sb=np.full(da_usb.shape, np.nan),
+        cross_2sb=np.full(da_usb.shape, np.nan, dtype=np.complex128),
         # attrs
         chassis=chassis,
         interface=interface,
         integ_time=da_usb.integ_time,
     )
+
+
+def to_zarrs(
+    ds_if1: xr.Dataset,
+    ds_if2: xr.Dataset,
+    zarr_if1: Path,
+    zarr_if2: Path,
+    /,
+    *,
+    # for data saving (optional)
+    integrate: bool = False,
+    append: bool = False,
+    join: XarrayJoin = "inner",
+) -> None:
+    """Write the Datasets of both IFs to Zarr files concurrently.
+
+    Args:
+        ds_if1: Dataset of the IF1 measurement.
+        ds_if2: Dataset of the IF2 measurement.
+        zarr_if1: Path of output Zarr file for IF1.
+        zarr_if2: Path of output Zarr file for IF2.
+        integrate: If True, the Datasets will be integrated along time.
+        append: If True, the Datasets will be appended to existing Zarr files.
+        join: Method for joining the Datasets of both IFs.
+
+    """
+
+    def save(ds: xr.Dataset, zarr: Path, /) -> None:
+        if integrate:
+            dim = {"time": ds.sizes["time"]}
+            coord_func = {"signal_chan": unique, "signal_sb": unique}
+            ds = ds.coarsen(dim, coord_func=coord_func).mean()  # type: ignore
+
+        if zarr.exists() and append:
+            ds.to_zarr(
+                zarr,
+                mode="a",
+                append_dim="time",
+                consolidated=True,
+            )  # type: ignore
+        else:
+            # chunk by the samples written per call so that appending
+            # to a ZipStore adds new chunks instead of rewriting one
+            n_time = min(ds.sizes["time"], ZARR_TIME_CHUNK)
+            encoding = {
+                name: {
+                    "chunks": (n_time, *ds[name].shape[1:]),
+                    **ZARR_ENCODING.get(name, {}),
+                }
+                for name in ("time", "signal_chan", "signal_sb", *ds.data_vars)
+            }
+            ds.to_zarr(
+                zarr,
+                mode="w",
+                encoding=encoding,
+                consolidated=True,
+            )  # type: ignore
+
+    # both IFs usually share the same indexes by construction
+    if not all(
+        ds_if1.indexes[dim].equals(ds_if2.indexes[dim]) for dim in ("time", "chan")
+    ):
+        ds_if1, ds_if2 = xr.align(ds_if1, ds_if2, join=join)
+
+    with ThreadPoolExecutor(2) as executor:
+        list(executor.map(save, (ds_if1, ds_if2), (zarr_if1, zarr_if2)))
@@ -3,14 +3,15 @@ __all__ = ["VDIF", "open_vdif"]
 
 # standard library
 from dataclasses import dataclass, field
-from typing import Literal as L, get_args
+from pathlib import Path
+from typing import Literal as L
 
 # dependencies
 import numpy as np
 import xarray as xr
 from numpy.typing import NDArray
 from xarray_dataclasses import AsDataArray, Attr, Coordof, Data, Dataof
-from .common import Chan, IntegTime, Time
+from .common import CHAN_RANGE, CHAN_TOTAL, INTEG_TIME_VALUES, Chan, IntegTime, Time
 from ..utils import StrPath, XarrayJoin
 
 # constants
@@ -21,6 +22,19 @@ REF_EPOCH_UNIT = np.timedelta64(6, "M")
 VDIF_HEADER_BYTES = 32
 VDIF_DATA_BYTES = 1024
 VDIF_FRAME_BYTES = VDIF_HEADER_BYTES + VDIF_DATA_BYTES
+VDIF_FRAME_DTYPE = np.dtype(
+    [
+        ("word_0", "u4"),
+        ("word_1", "u4"),
+        ("word_2", "u4"),
+        ("word_3", "u4"),
+        ("word_4", "u4"),
+        ("word_5", "u4"),
+        ("word_6", "u4"),
+        ("word_7", "u4"),
+        ("data", ("f4", 256)),
+    ]
+)
 
 
 # data classes
@@ -94,20 +108,7 @@ def open_vdif(
             integration time is other than 100|200|500|1000 ms.
 
     """
-    array = np.fromfile(
-        vdif,
-        dtype=[
-            ("word_0", "u4"),
-            ("word_1", "u4"),
-            ("word_2", "u4"),
-            ("word_3", "u4"),
-            ("word_4", "u4"),
-            ("word_5", "u4"),
-            ("word_6", "u4"),
-            ("word_7", "u4"),
-            ("data", ("f4", 256)),
-        ],
-    )
+    array = memmap_vdif(vdif)
     word_0 = Word(array["word_0"])
     word_1 = Word(array["word_1"])
     seconds = word_0[0:30]
@@ -117,7 +118,7 @@ def open_vdif(
     if integ_time is None:
         integ_time = infer_integ_time(frame_num)
 
-    if integ_time not in get_args(IntegTime):
+    if integ_time not in INTEG_TIME_VALUES:
         raise ValueError("Spectral integration time must be 100|200|500|1000.")
 
     time = (
@@ -127,18 +128,35 @@ def open_vdif(
         + np.timedelta64(integ_time, "ms") * (frame_num // 2)
     )
 
+    is_odd = (frame_num & 1).astype(bool)
+    index_even = np.flatnonzero(~is_odd)
+    index_odd = np.flatnonzero(is_odd)
+
+    # fast path: both halves of every spectrum are present in the same order
+    if np.array_equal(time[index_even], time[index_odd]):
+        auto = np.empty((len(index_even), CHAN_TOTAL))
+        auto[:, : CHAN_TOTAL // 2] = array["data"][index_even]
+        auto[:, CHAN_TOTAL // 2 :] = array["data"][index_odd]
+
+        return VDIF.new(
+            time=time[index_even],
+            chan=CHAN_RANGE,
+            auto=auto,
+            integ_time=integ_time,
+        )
+
     return xr.concat(
         (
             VDIF.new(
-                time=time[frame_num % 2 == 0],
+                time=time[index_even],
                 chan=CHAN_FIRST_HALF,
-                auto=array["data"][frame_num % 2 == 0],
+                auto=array["data"][index_even],
                 integ_time=integ_time,
             ),
             VDIF.new(
-                time=time[frame_num % 2 == 1],
+                time=time[index_odd],
                 chan=CHAN_SECOND_HALF,
-                auto=array["data"][frame_num % 2 == 1],
+                auto=array["data"][index_odd],
                 integ_time=integ_time,
             ),
         ),
@@ -147,12 +165,25 @@ def open_vdif(
     )
 
 
+def memmap_vdif(vdif: StrPath, /) -> NDArray[np.void]:
+    """Memory-map a VDIF file as a read-only structured array of frames.
+
+    Only the frames actually accessed are paged in from the file,
+    and a trailing incomplete frame (if any) is ignored.
+
+    """
+    if not (n_frames := Path(vdif).stat().st_size // VDIF_FRAME_BYTES):
+        return np.empty(0, VDIF_FRAME_DTYPE)
+
+    return np.memmap(vdif, VDIF_FRAME_DTYPE, mode="r", shape=(n_frames,))
+
+
 def infer_integ_time(frame_num: NDArray[np.int_], /) -> IntegTime:
     """Infer spectral integration time from frame number."""
-    if sum(frame_num == (frame_max := max(frame_num))) < 2:
+    if np.count_nonzero(frame_num == (frame_max := frame_num.max())) < 2:
         raise RuntimeError("Could not infer spectral integration time.")
 
-    if (integ_time := 2000 // (frame_max + 1)) not in get_args(IntegTime):
+    if (integ_time := 2000 // (frame_max + 1)) not in INTEG_TIME_VALUES:
         raise ValueError("Spectral integration time must be 100|200|500|1000.")
 
     return integ_time
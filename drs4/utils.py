@@ -1,15 +1,25 @@
-__all__ = ["StrPath", "XarrayJoin", "is_strpath", "set_logger", "set_workdir", "unique"]
+__all__ = [
+    "SSH_OPTIONS",
+    "StrPath",
+    "XarrayJoin",
+    "get_env",
+    "is_strpath",
+    "set_logger",
+    "set_workdir",
+    "unique",
+]
 
 
 # standard library
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
+from functools import cache
 from logging import FileHandler, Formatter, StreamHandler, getLogger
-from os import PathLike
+from os import PathLike, getenv
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import gmtime
-from typing import Any, Literal as L
+from typing import Any, Literal as L, TypeVar
 
 # dependencies
 import numpy as np
@@ -18,14 +28,58 @@ from typing_extensions import TypeGuard
 
 # constants
 LOGGER = getLogger(__name__)
+SSH_OPTIONS = (  # reuse an SSH connection to DRS4 for successive commands
+    "-o",
+    "ControlMaster=auto",
+    "-o",
+    "ControlPath=~/.ssh/cm-drs4-%r@%h:%p",
+    "-o",
+    "ControlPersist=60s",
+)
 
 
 # type hints
+T = TypeVar("T")
 Axis = Sequence[int] | int | None
 StrPath = PathLike[str] | str
 XarrayJoin = L["outer", "inner", "left", "right", "exact", "override"]
 
 
+def get_env(name: str, type: Callable[[str], T], default: T | None = None, /) -> T:
+    """Return the value of an environment variable converted to a type.
+
+    Args:
+        name: Name of the environment variable.
+        type: Type (or function) to convert the value (e.g. int).
+        default: Value returned if the environment variable is not set.
+
+    Returns:
+        Converted value. Only the conversion of each raw value is cached,
+        so the environment variable is always read (and may change).
+
+    Raises:
+        ValueError: Raised if the environment variable is not set
+            without default or its value cannot be converted to the type.
+
+    """
+    if (value := getenv(name)) is None and default is None:
+        raise ValueError(f"{name} must be set.")
+
+    if value is None:
+        return default  # type: ignore
+
+    try:
+        return convert(value, type)
+    except ValueError:
+        raise ValueError(f"{name} cannot be parsed as {type.__name__}.") from None
+
+
+@cache
+def convert(value: str, type: Callable[[str], T], /) -> T:
+    """Convert a string to a type (cached by the string and the type)."""
+    return type(value)
+
+
 def is_strpath(obj: Any, /) -> TypeGuard[StrPath]:
     """Check if given object can provide a file system path."""
     return isinstance(obj, (PathLike, str))
@@ -37,28 +91,43 @@ def set_workdir(workdir: StrPath | None = None, /) -> Iterator[Path]:
     if workdir is not None:
         yield Path(workdir).expanduser()
     else:
-        with TemporaryDirectory() as workdir:
+        with TemporaryDirectory(ignore_cleanup_errors=True) as workdir:
             yield Path(workdir)
 
 
 def unique(array: NDArray[Any], /, axis: Axis = None) -> NDArray[Any]:
     """Return unique values along given axis (axes)."""
     if axis is None:
-        axis = list(range(array.ndim))
+        axes = tuple(range(array.ndim))
+    elif isinstance(axis, Sequence):
+        axes = tuple(ax % array.ndim for ax in axis)
+    else:
+        axes = (axis % array.ndim,)
+
+    if any(array.shape[ax] == 0 for ax in axes):
+        raise ValueError("Array values are not unique.")
+
+    first = array[tuple(0 if ax in axes else slice(None) for ax in range(array.ndim))]
+
+    # single values are unique even if they are NaN (NaT)
+    if all(array.shape[ax] == 1 for ax in axes):
+        return first
 
-    axes = np.atleast_1d(axis)
-    shape = np.array(array.shape)
-    newshape = np.prod(shape[axes]), *np.delete(shape, axes)
+    # compare all values with the first ones along the axes in a single pass
+    expanded = np.expand_dims(first, axes)
+    equal = array == expanded
 
-    for ax in axes:
-        array = np.moveaxis(array, ax, 0)
+    # NaN (NaT) is regarded as unique only if reduced to a scalar (as np.unique)
+    if len(axes) == array.ndim and array.dtype.kind in "fc":
+        equal |= np.isnan(array) & np.isnan(expanded)
 
-    result = np.unique(array.reshape(newshape), axis=0)
+    if len(axes) == array.ndim and array.dtype.kind in "mM":
+        equal |= np.isnat(array) & np.isnat(expanded)
 
-    if result.shape[0] != 1:
+    if not np.all(equal):
         raise ValueError("Array values are not unique.")
 
-    return result[0]
+    return first
 
 
 def set_logger(
@@ -0,0 +1,19 @@
+# dependencies
+from pytest import mark
+from drs4.ctrl.scpi import to_compound
+
+
+# test functions
+@mark.parametrize(
+    "commands, expected",
+    [
+        (["AMPL?", "FREQ?", "OUTP?"], "AMPL?;:FREQ?;:OUTP?"),
+        (["*IDN?", "*OPC?"], "*IDN?;*OPC?"),
+        (["AMPL?", ":FREQ?", "*OPC?"], "AMPL?;:FREQ?;*OPC?"),
+        (["FREQ 1GHz", "*OPC?"], None),
+        (["*RST"], None),
+        ([], None),
+    ],
+)
+def test_to_compound(commands: list[str], expected: str | None) -> None:
+    assert to_compound(commands) == expected
@@ -0,0 +1,49 @@
+# standard library
+from os import devnull
+from socket import SO_RCVBUF, SOCK_DGRAM, SOL_SOCKET, socket
+
+# dependencies
+from pytest import mark
+from drs4.daq.udp import RECVMMSG, SO_RXQ_OVFL, FrameBuffer
+from drs4.specs.vdif import VDIF_FRAME_BYTES
+
+
+# test functions
+@mark.skipif(RECVMMSG is None, reason="recvmmsg(2) is not available.")
+def test_frame_buffer_dropped() -> None:
+    with (
+        socket(type=SOCK_DGRAM) as receiver,
+        socket(type=SOCK_DGRAM) as sender,
+        open(devnull, "wb", buffering=0) as file,
+    ):
+        receiver.setsockopt(SOL_SOCKET, SO_RCVBUF, 4096)
+        receiver.setsockopt(SOL_SOCKET, SO_RXQ_OVFL, 1)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.setblocking(False)
+        buffer = FrameBuffer(8, VDIF_FRAME_BYTES)
+
+        def send(n_frames: int, /) -> None:
+            for _ in range(n_frames):
+                sender.sendto(bytes(VDIF_FRAME_BYTES), receiver.getsockname())
+
+        def drain() -> int:
+            n_received = 0
+
+            while n_frames := buffer.recv(receiver):
+                n_received += n_frames
+                buffer.flush(file)
+
+            return n_received
+
+        # a clean batch (no drop counter attached by the kernel)
+        send(1)
+        n_received = drain()
+        assert n_received == 1
+        assert buffer.n_dropped == 0
+
+        # an overflowing batch (reported by the next queued frame)
+        send(200)
+        n_received += drain()
+        send(1)
+        n_received += drain()
+        assert buffer.n_dropped == 202 - n_received > 0
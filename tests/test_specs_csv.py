@@ -0,0 +1,67 @@
+# dependencies
+import numpy as np
+import pandas as pd
+from pytest import mark
+from drs4.specs.csv import (
+    COL_FREQ,
+    COL_LSB,
+    COL_TIME,
+    COL_USB,
+    TIME_DEFAULT,
+    read_csv,
+    to_grid,
+)
+
+# test data
+TIME = pd.to_datetime(["2000-01-01T00:00:00", "2000-01-01T00:00:01"])
+FREQ = [19.0, 19.5, 20.0]
+DF = pd.DataFrame(
+    {
+        COL_TIME: np.repeat(TIME, len(FREQ)),
+        COL_FREQ: np.tile(FREQ, len(TIME)),
+        COL_USB: np.arange(6.0),
+        COL_LSB: -np.arange(6.0),
+    }
+)
+
+
+# test functions
+@mark.parametrize(
+    "df",
+    [
+        DF,  # regular rows (reshaped)
+        DF.iloc[::-1],  # reversed rows (scattered)
+        DF.drop(index=4),  # missing row (scattered and NaN-filled)
+    ],
+)
+def test_to_grid(df: pd.DataFrame) -> None:
+    expected = df.set_index([COL_TIME, COL_FREQ]).to_xarray()
+    time, (usb, lsb) = to_grid(df, COL_USB, COL_LSB)
+
+    np.testing.assert_array_equal(time, expected[COL_TIME].data)
+    np.testing.assert_array_equal(usb, expected[COL_USB].data)
+    np.testing.assert_array_equal(lsb, expected[COL_LSB].data)
+
+
+@mark.parametrize(
+    "times, expected",
+    [
+        (["2000-01-01T00:00:00.500000"] * 2, ["2000-01-01T00:00:00.5"] * 2),
+        (
+            ["2000-01-01T00:00:00", "2000-01-01T00:00:01.5"],
+            ["2000-01-01T00:00:00", "2000-01-01T00:00:01.5"],
+        ),
+        (["2000-01-01 00:00:01"] * 2, ["2000-01-01T00:00:01"] * 2),
+        (None, [TIME_DEFAULT] * 2),
+    ],
+)
+def test_read_csv(tmp_path, times: list[str] | None, expected: list[str]) -> None:
+    df = DF.iloc[:2].drop(columns=COL_TIME)
+
+    if times is not None:
+        df.insert(0, COL_TIME, times)
+
+    df.to_csv(csv := tmp_path / "test.csv", index=False)
+    np.testing.assert_array_equal(
+        read_csv(csv)[COL_TIME], pd.to_datetime(expected, format="ISO8601")
+    )
@@ -0,0 +1,19 @@
+# dependencies
+import numpy as np
+from drs4.specs.gain import mean_by_chan, to_hex
+
+
+# test functions
+def test_mean_by_chan() -> None:
+    values = np.array([1 + 1j, 3 + 3j, np.nan, 2 - 2j, complex(1, np.nan)])
+    chan = np.array([0, 0, 0, 2, 2])
+    expected = np.array([2 + 2j, 0, 2 - 2j, 0])
+
+    np.testing.assert_array_equal(mean_by_chan(values, chan, 4), expected)
+
+
+def test_to_hex() -> None:
+    array = np.array([[0, 1, 8192], [0x7FFFFFFF, 0xFFFFFFFF, -8192 & 0xFFFFFFFF]])
+    expected = np.vectorize("{:#010x}".format)(array)
+
+    np.testing.assert_array_equal(to_hex(array), expected)
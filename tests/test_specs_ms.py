@@ -0,0 +1,41 @@
+# dependencies
+import numpy as np
+import xarray as xr
+from pytest import mark
+from drs4.specs.ms import MS, to_zarrs
+
+
+# test functions
+@mark.parametrize("integrate", [False, True])
+def test_to_zarrs_broadcast(tmp_path, integrate: bool) -> None:
+    def new(start: int, n_time: int, /) -> xr.Dataset:
+        return MS.new(
+            time=np.datetime64("2000", "ns") + np.arange(start, start + n_time),
+            chan=np.arange(4),
+            freq=np.arange(4.0),
+            signal_sb=np.broadcast_to(np.array("USB", "U3"), n_time),
+            signal_chan=np.broadcast_to(np.array(1, np.int64), n_time),
+            auto_usb=np.ones((n_time, 4)),
+            auto_lsb=np.ones((n_time, 4)),
+            cross_2sb=np.ones((n_time, 4), np.complex128),
+            chassis=1,
+            interface=1,
+            integ_time=100,
+        )
+
+    zarr_if1, zarr_if2 = tmp_path / "if1.zarr", tmp_path / "if2.zarr"
+
+    for start in (0, 2):
+        to_zarrs(
+            new(start, 2),
+            new(start, 2),
+            zarr_if1,
+            zarr_if2,
+            integrate=integrate,
+            append=True,
+        )
+
+    ds = xr.open_zarr(zarr_if1)
+    assert ds.sizes["time"] == (2 if integrate else 4)
+    assert (ds.signal_sb == "USB").all()
+    assert (ds.signal_chan == 1).all()
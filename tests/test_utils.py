@@ -0,0 +1,62 @@
+# dependencies
+import numpy as np
+from pytest import MonkeyPatch, mark, raises
+from drs4.utils import get_env, unique
+
+# test data
+NaT = np.datetime64("NaT", "ns")
+TIME = np.datetime64("2000-01-01", "ns")
+
+
+# test functions
+@mark.parametrize(
+    "array, axis, expected",
+    [
+        (np.array([1, 1, 1]), None, np.int64(1)),
+        (np.array(["NA", "NA"]), None, np.str_("NA")),
+        (np.array([np.nan, np.nan]), None, np.float64(np.nan)),
+        (np.array([NaT, NaT]), None, NaT),
+        (np.array([[1, 2], [1, 2]]), 0, np.array([1, 2])),
+        (np.array([[1, 1], [2, 2]]), 1, np.array([1, 2])),
+        (np.array([[1, 1], [2, 2]]), -1, np.array([1, 2])),
+        (np.ones((2, 3, 4)), (0, 2), np.ones(3)),
+        (np.array([[np.nan, np.nan]]), 0, np.array([np.nan, np.nan])),
+    ],
+)
+def test_unique(array: np.ndarray, axis: int | None, expected: np.ndarray) -> None:
+    np.testing.assert_array_equal(unique(array, axis=axis), expected)
+
+
+@mark.parametrize(
+    "array, axis",
+    [
+        (np.array([1, 2]), None),
+        (np.array([1.0, np.nan]), None),
+        (np.array([[1, 2], [1, 3]]), 0),
+        (np.array([[np.nan, 1.0], [np.nan, 1.0]]), 0),
+        (np.array([[NaT, TIME], [NaT, TIME]]), 0),
+        (np.zeros(0), None),
+    ],
+)
+def test_unique_error(array: np.ndarray, axis: int | None) -> None:
+    with raises(ValueError):
+        unique(array, axis=axis)
+
+
+def test_get_env(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("DRS4_TEST", raising=False)
+    assert get_env("DRS4_TEST", int, 0) == 0
+
+    with raises(ValueError):
+        get_env("DRS4_TEST", int)
+
+    # a changed value must not be shadowed by the cache
+    monkeypatch.setenv("DRS4_TEST", "1")
+    assert get_env("DRS4_TEST", int) == 1
+    monkeypatch.setenv("DRS4_TEST", "2")
+    assert get_env("DRS4_TEST", int) == 2
+
+    monkeypatch.setenv("DRS4_TEST", "")
+
+    with raises(ValueError):
+        get_env("DRS4_TEST", int, 0)